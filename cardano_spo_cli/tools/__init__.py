@@ -1,6 +1,10 @@
 """Cardano SPO CLI tools package."""
 
-from .wallet import generate_wallet_real, generate_stake_pool_real
+from .wallet import (
+    generate_wallet_real,
+    generate_stake_pool_real,
+    generate_wallets_batch,
+)
 from .wallet_simple import generate_wallet_simple
 from .export import export_wallet_files, list_wallet_files
 from .secure import secure_wallet_files, view_wallet_files, restore_wallet_files
@@ -8,6 +12,7 @@ from .secure import secure_wallet_files, view_wallet_files, restore_wallet_files
 __all__ = [
     "generate_wallet_real",
     "generate_stake_pool_real",
+    "generate_wallets_batch",
     "generate_wallet_simple",
     "export_wallet_files",
     "list_wallet_files",
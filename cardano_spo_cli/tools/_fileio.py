@@ -0,0 +1,53 @@
+"""Raw file helpers shared by the wallet generators."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+# os.open() defaults to text mode on Windows, which would translate newlines
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+def write_file(path: str, content: str, mode: int = 0o666) -> None:
+    """Write one file, applying its mode at creation"""
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_BINARY, mode)
+    except FileExistsError:
+        fd = os.open(path, os.O_WRONLY | os.O_TRUNC | _O_BINARY)
+        if mode != 0o666:
+            # open() keeps an existing file's mode. Change the file we opened
+            # rather than resolving the path again
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, mode)
+            else:
+                os.chmod(path, mode)
+    try:
+        data = content.encode()
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def write_files(files: List[Tuple[str, str, int]]) -> None:
+    """Write (path, content, mode) entries concurrently on a few threads"""
+    with ThreadPoolExecutor(max_workers=min(8, len(files) or 1)) as executor:
+        for future in [executor.submit(write_file, *entry) for entry in files]:
+            future.result()
+
+
+def read_files(paths: List[str]) -> List[bytes]:
+    """Read small files with raw os calls, skipping the buffered io stack"""
+    contents = []
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY | _O_BINARY)
+        try:
+            chunks = []
+            chunk = os.read(fd, 65536)
+            while chunk:
+                chunks.append(chunk)
+                chunk = os.read(fd, 65536)
+        finally:
+            os.close(fd)
+        contents.append(b"".join(chunks))
+    return contents
@@ -181,45 +181,8 @@ def verify_tools() -> Dict[str, Path]:
 
             # Check if we have sufficient tools for real mode (at least cardano-address)
         if "cardano-address" in tools:
-            # Additional check for ARM64 cardano-cli crash
-            if "cardano-cli" in tools:
-                # Check if we're on ARM64 macOS
-                import platform
-
-                is_arm64_macos = (
-                    platform.system() == "Darwin"
-                    and platform.machine() in ["arm64", "aarch64"]
-                )
-
-                if is_arm64_macos:
-                    # On ARM64 macOS, cardano-cli is known to crash due to Nix dependencies
-                    # But we can still use cardano-address and bech32 for real mode
-                    click.echo(
-                        "ℹ️  cardano-cli may crash on ARM64 macOS (known compatibility issue)"
-                    )
-                    click.echo("✅ Using cardano-address and bech32 for real mode")
-                    # Keep cardano-cli but don't test it
-                else:
-                    # Test cardano-cli on other platforms
-                    try:
-                        result = subprocess.run(
-                            [str(tools["cardano-cli"]), "--version"],
-                            capture_output=True,
-                            text=True,
-                            timeout=5,
-                        )
-                        if result.returncode != 0:
-                            # Remove crashing cardano-cli from tools
-                            del tools["cardano-cli"]
-                            click.echo("⚠️  cardano-cli crashes, using simplified mode")
-                            return {}
-                    except Exception:
-                        # Remove crashing cardano-cli from tools
-                        if "cardano-cli" in tools:
-                            del tools["cardano-cli"]
-                        click.echo("⚠️  cardano-cli crashes, using simplified mode")
-                        return {}
-
+            # Whether cardano-cli actually runs is checked (and cached) by
+            # CardanoWalletGenerator, which falls back to cardano-address
             click.echo("✅ Sufficient tools available for real mode")
             return tools
 
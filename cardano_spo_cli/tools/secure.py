@@ -3,10 +3,9 @@
 
 import os
 import base64
+import hashlib
 from pathlib import Path
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import click
 
 
@@ -15,13 +14,8 @@ def derive_key_from_password(password: str, salt: bytes = None) -> tuple[bytes,
     if salt is None:
         salt = os.urandom(16)
 
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=100000,
-    )
-    key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+    derived = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, 100000, 32)
+    key = base64.urlsafe_b64encode(derived)
     return key, salt
 
 
@@ -31,8 +25,7 @@ def encrypt_file(file_path: Path, password: str) -> dict:
         raise FileNotFoundError(f"File not found: {file_path}")
 
     # Read original file
-    with open(file_path, "rb") as f:
-        original_data = f.read()
+    original_data = file_path.read_bytes()
 
     # Derive key from password
     key, salt = derive_key_from_password(password)
@@ -4,32 +4,459 @@ Wallet generation module for Cardano SPO CLI using real Cardano tools
 
 import os
 import json
+import asyncio
+import contextlib
+import functools
+import hashlib
+import itertools
 import secrets
+import shutil
 import subprocess
+import sys
+import tempfile
+from collections import OrderedDict
+from types import MappingProxyType, SimpleNamespace
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import click
 from mnemonic import Mnemonic
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import bech32
 from colorama import Fore, Style
 
+from ._fileio import read_files, write_file, write_files
 from .download import verify_tools
+from .wallet_simple import SimpleCardanoWalletGenerator
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        """Serialize obj as indented JSON (same layout as the json fallback)"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> str:
+        """Serialize obj as indented JSON"""
+        return json.dumps(obj, indent=2)
+
+
+@functools.lru_cache(maxsize=None)
+def _native() -> Optional[SimpleNamespace]:
+    """Load pycardano (pip install cardano-spo-cli[native]), or None if missing"""
+    # Imported on first use: pycardano is slow to import and most commands
+    # never derive keys
+    try:
+        from nacl import bindings as nacl_bindings
+        from pycardano import (
+            Address,
+            Network,
+            PaymentVerificationKey,
+            StakeVerificationKey,
+        )
+        from pycardano.crypto.bip32 import HDWallet
+    except ImportError:
+        return None
+    return SimpleNamespace(
+        Address=Address,
+        Network=Network,
+        PaymentVerificationKey=PaymentVerificationKey,
+        StakeVerificationKey=StakeVerificationKey,
+        HDWallet=HDWallet,
+        public_key=nacl_bindings.crypto_scalarmult_ed25519_base_noclamp,
+    )
+
+
+# Key prefixes used by cardano-address for each CIP-1852 role
+_ROLE_KEY_PREFIXES = {
+    "0": "addr",
+    "1": "addr",
+    "2": "stake",
+    "3": "drep",
+    "4": "cc_cold",
+    "5": "cc_hot",
+}
+
+# Cardano CLI text envelope types for each key file we write
+_KEY_TYPE_MAPPING = MappingProxyType(
+    {
+        "payment_skey": "PaymentSigningKeyShelley_ed25519",
+        "payment_vkey": "PaymentVerificationKeyShelley_ed25519",
+        "stake_skey": "StakeSigningKeyShelley_ed25519",
+        "stake_vkey": "StakeVerificationKeyShelley_ed25519",
+        "cold_skey": "ConstitutionalCommitteeColdSigningKey_ed25519",
+        "cold_vkey": "ConstitutionalCommitteeColdVerificationKey_ed25519",
+        "hot_skey": "ConstitutionalCommitteeHotSigningKey_ed25519",
+        "hot_vkey": "ConstitutionalCommitteeHotVerificationKey_ed25519",
+        "drep_skey": "DRepSigningKey_ed25519",
+        "drep_vkey": "DRepVerificationKey_ed25519",
+        "ms_payment_skey": "PaymentSigningKeyShelley_ed25519",
+        "ms_payment_vkey": "PaymentVerificationKeyShelley_ed25519",
+        "ms_stake_skey": "StakeSigningKeyShelley_ed25519",
+        "ms_stake_vkey": "StakeVerificationKeyShelley_ed25519",
+        "ms_drep_skey": "DRepSigningKey_ed25519",
+        "ms_drep_vkey": "DRepVerificationKey_ed25519",
+    }
+)
+
+# BCH generator constants for the Bech32 checksum (BIP-0173)
+_BECH32_GENERATOR = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+# XOR of the generators selected by each possible 5-bit overflow, so the
+# checksum loop does one table lookup per word instead of five branches
+_BECH32_GENERATOR_TABLE = tuple(
+    functools.reduce(
+        lambda chk, i: chk ^ _BECH32_GENERATOR[i] if top >> i & 1 else chk,
+        range(5),
+        0,
+    )
+    for top in range(32)
+)
+_BECH32_CHARSET_INDEX = {char: index for index, char in enumerate(bech32.CHARSET)}
+
+
+def _bech32_polymod(values: List[int]) -> int:
+    """Compute the Bech32 checksum polynomial"""
+    table = _BECH32_GENERATOR_TABLE
+    chk = 1
+    for value in values:
+        chk = (chk & 0x1FFFFFF) << 5 ^ value ^ table[chk >> 25]
+    return chk
+
+
+def _bech32_encode(hrp: str, data: bytes) -> str:
+    """Encode raw bytes as Bech32 (no 90 character limit, as used by Cardano)"""
+    # Regroup the bytes into 5-bit words, zero padding the last one
+    bit_count = len(data) * 8
+    padding = -bit_count % 5
+    value = int.from_bytes(data, "big") << padding
+    words = [(value >> shift) & 31 for shift in range(bit_count + padding - 5, -1, -5)]
+
+    polymod = _bech32_polymod(bech32.bech32_hrp_expand(hrp) + words + [0] * 6) ^ 1
+    checksum = [(polymod >> shift) & 31 for shift in (25, 20, 15, 10, 5, 0)]
+    return hrp + "1" + "".join([bech32.CHARSET[word] for word in words + checksum])
+
+
+def _bech32_decode(value: str) -> Tuple[Optional[str], Optional[bytes]]:
+    """Decode a Bech32 string into its prefix and raw bytes"""
+    # BIP-173: printable US-ASCII only, and either case but not a mix
+    if any(ord(char) < 33 or ord(char) > 126 for char in value):
+        return None, None
+    if value != value.lower() and value != value.upper():
+        return None, None
+    hrp, _, payload = value.lower().rpartition("1")
+    try:
+        data = [_BECH32_CHARSET_INDEX[char] for char in payload]
+    except KeyError:
+        return None, None
+    if not hrp or len(data) < 6:
+        return None, None
+    if _bech32_polymod(bech32.bech32_hrp_expand(hrp) + data) != 1:
+        return None, None
+    # Regroup the 5-bit words into bytes; the padding must be under a byte
+    # and all zero, as convertbits() would insist
+    words = data[:-6]
+    padding = len(words) * 5 % 8
+    value = 0
+    for word in words:
+        value = value << 5 | word
+    if padding >= 5 or value & ((1 << padding) - 1):
+        return None, None
+    return hrp, (value >> padding).to_bytes(len(words) * 5 // 8, "big")
+
+
+def _run_async(coro):
+    """Run a coroutine that spawns subprocesses in a fresh event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        # Called from async code, whose loop can't be nested: run in a thread
+        # with its own loop, leaving the shared child watcher alone
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    # Before 3.12 the default child watcher parks a thread in waitpid() per
+    # child; a PidfdChildWatcher reaps them all from the event loop
+    if sys.version_info >= (3, 12) or not hasattr(os, "pidfd_open"):
+        # 3.12+ already picks pidfds when the kernel supports them
+        return asyncio.run(coro)
+
+    loop = asyncio.new_event_loop()
+    try:
+        pidfd = os.pidfd_open(os.getpid())
+    except OSError:
+        # Kernel older than 5.3 or pidfd_open blocked by a seccomp filter
+        loop.close()
+        return asyncio.run(coro)
+    os.close(pidfd)
+
+    # Put the caller's watcher back afterwards (the default threaded one
+    # keeps no state, so it stays usable across the swap)
+    previous = asyncio.get_child_watcher()
+    watcher = asyncio.PidfdChildWatcher()
+    asyncio.set_child_watcher(watcher)
+    watcher.attach_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        asyncio.set_child_watcher(previous)
+        loop.close()
+
+
+# Bech32 prefixes of the key and key hash strings we convert to CBOR
+_BECH32_KEY_PREFIXES = ("addr_vkh", "stake_vkh", "addr_vk", "stake_vk")
+
+
+def _try_bech32(
+    value: str, prefixes: Tuple[str, ...] = _BECH32_KEY_PREFIXES
+) -> Optional[bytes]:
+    """Decode value if it is Bech32 with one of prefixes, else return None"""
+    # Checking the prefix first spares hex input the checksum
+    if value.rpartition("1")[0] not in prefixes:
+        return None
+    return _bech32_decode(value)[1]
+
+
+def _generate_mnemonic(wordlist: List[str], strength: int = 256) -> str:
+    """Generate a BIP-39 recovery phrase from fresh entropy"""
+    entropy = secrets.token_bytes(strength // 8)
+    # Entropy and checksum as one integer, sliced into 11-bit word indices
+    checksum_bits = strength // 32
+    checksum = hashlib.sha256(entropy).digest()[0] >> (8 - checksum_bits)
+    bits = int.from_bytes(entropy, "big") << checksum_bits | checksum
+    word_count = (strength + checksum_bits) // 11
+    return " ".join(
+        wordlist[(bits >> (11 * index)) & 0x7FF]
+        for index in reversed(range(word_count))
+    )
+
+
+def _mnemonic_fingerprint(mnemonic: str) -> str:
+    """Fingerprint identifying the mnemonic a cached root key belongs to"""
+    return hashlib.sha256(mnemonic.encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=256)
+def _cbor_hex_to_bech32(cbor_hex: str, prefix: str) -> str:
+    """Convert CBOR hex to Bech32 format (cached, imported keys repeat)"""
+    # Remove CBOR tag and length
+    key_hex = cbor_hex[4:] if cbor_hex.startswith("58") else cbor_hex
+    try:
+        key_data = bytes.fromhex(key_hex)
+    except ValueError:
+        return f"{prefix}1placeholder"
+
+    return _bech32_encode(prefix, key_data)
+
+
+# Validated (base, reward) addresses of recently imported key pairs, shared
+# by every generator since each call builds a new one; least recent first
+_IMPORTED_ADDRESSES: Dict[Tuple[str, str, str], Tuple[str, str]] = OrderedDict()
+_IMPORTED_ADDRESSES_SIZE = 32
 
 
 class CardanoWalletGenerator:
     """Cardano wallet generator using real Cardano tools"""
 
-    def __init__(self, ticker: str):
+    # Network tags used by cardano-address
+    _NETWORK_TAGS = MappingProxyType(
+        {"mainnet": "1", "testnet": "0", "preview": "0", "preprod": "0"}
+    )
+
+    # CBOR byte string headers for raw key hex, by hex length (32/64 bytes)
+    _CBOR_HEX_HEADERS = MappingProxyType({64: "5820", 128: "5840"})
+
+    # Network selection arguments used by cardano-cli
+    _CLI_NETWORK_ARGS = MappingProxyType(
+        {
+            "mainnet": ("--mainnet",),
+            "testnet": ("--testnet-magic", "1097911063"),
+            "preview": ("--testnet-magic", "2"),
+            "preprod": ("--testnet-magic", "1"),
+        }
+    )
+
+    # cardano-cli key-gen commands: (name, subcommand, vkey flag, skey flag)
+    _CLI_KEY_GENS = (
+        (
+            "payment",
+            ("address", "key-gen"),
+            "--verification-key-file",
+            "--signing-key-file",
+        ),
+        (
+            "staking",
+            ("stake-address", "key-gen"),
+            "--verification-key-file",
+            "--signing-key-file",
+        ),
+        (
+            "cold",
+            ("conway", "governance", "committee", "key-gen-cold"),
+            "--cold-verification-key-file",
+            "--cold-signing-key-file",
+        ),
+        (
+            "hot",
+            ("conway", "governance", "committee", "key-gen-hot"),
+            "--verification-key-file",
+            "--signing-key-file",
+        ),
+        (
+            "drep",
+            ("conway", "governance", "drep", "key-gen"),
+            "--verification-key-file",
+            "--signing-key-file",
+        ),
+        (
+            "ms_payment",
+            ("address", "key-gen"),
+            "--verification-key-file",
+            "--signing-key-file",
+        ),
+        (
+            "ms_stake",
+            ("stake-address", "key-gen"),
+            "--verification-key-file",
+            "--signing-key-file",
+        ),
+        (
+            "ms_drep",
+            ("conway", "governance", "drep", "key-gen"),
+            "--verification-key-file",
+            "--signing-key-file",
+        ),
+    )
+
+    # cardano-cli key-hash commands: (credential, key pair, group, vkey flag)
+    _CLI_KEY_HASHES = (
+        ("payment_cred", "payment", "address", "--payment-verification-key-file"),
+        ("stake_cred", "staking", "stake-address", "--stake-verification-key-file"),
+        (
+            "ms_payment_cred",
+            "ms_payment",
+            "address",
+            "--payment-verification-key-file",
+        ),
+        (
+            "ms_stake_cred",
+            "ms_stake",
+            "stake-address",
+            "--stake-verification-key-file",
+        ),
+    )
+
+    # Key files written by save_complete_wallet_files:
+    # (file name, wallet_data key, key type, description)
+    _WALLET_KEY_FILES = (
+        ("payment.skey", "payment_skey", "payment_skey", "Payment Signing Key"),
+        ("payment.vkey", "payment_vkey", "payment_vkey", "Payment Verification Key"),
+        ("stake.skey", "staking_skey", "stake_skey", "Stake Signing Key"),
+        ("stake.vkey", "staking_vkey", "stake_vkey", "Stake Verification Key"),
+        (
+            "cc-cold.skey",
+            "cold_skey",
+            "cold_skey",
+            "Constitutional Committee Cold Signing Key",
+        ),
+        (
+            "cc-cold.vkey",
+            "cold_vkey",
+            "cold_vkey",
+            "Constitutional Committee Cold Verification Key",
+        ),
+        (
+            "cc-hot.skey",
+            "hot_skey",
+            "hot_skey",
+            "Constitutional Committee Hot Signing Key",
+        ),
+        (
+            "cc-hot.vkey",
+            "hot_vkey",
+            "hot_vkey",
+            "Constitutional Committee Hot Verification Key",
+        ),
+        (
+            "drep.skey",
+            "drep_skey",
+            "drep_skey",
+            "Delegated Representative Signing Key",
+        ),
+        (
+            "drep.vkey",
+            "drep_vkey",
+            "drep_vkey",
+            "Delegated Representative Verification Key",
+        ),
+        (
+            "ms_payment.skey",
+            "ms_payment_skey",
+            "ms_payment_skey",
+            "Payment Signing Key",
+        ),
+        (
+            "ms_payment.vkey",
+            "ms_payment_vkey",
+            "ms_payment_vkey",
+            "Payment Verification Key",
+        ),
+        ("ms_stake.skey", "ms_stake_skey", "ms_stake_skey", "Stake Signing Key"),
+        (
+            "ms_stake.vkey",
+            "ms_stake_vkey",
+            "ms_stake_vkey",
+            "Stake Verification Key",
+        ),
+        (
+            "ms_drep.skey",
+            "ms_drep_skey",
+            "ms_drep_skey",
+            "Multi-Signature DRep Signing Key",
+        ),
+        (
+            "ms_drep.vkey",
+            "ms_drep_vkey",
+            "ms_drep_vkey",
+            "Multi-Signature DRep Verification Key",
+        ),
+    )
+
+    # Derivation paths for each key kind handled by _derive
+    _DERIVATION_PATHS = MappingProxyType(
+        {
+            "payment": "1852H/1815H/0H/0/0",
+            "payment_internal": "1852H/1815H/0H/1/0",
+            "staking": "1852H/1815H/0H/2/0",
+            "cold": "1852H/1815H/0H/3/0",
+            "hot": "1852H/1815H/0H/4/0",
+            "drep": "1852H/1815H/0H/5/0",
+            "ms_payment": "1852H/1815H/0H/6/0",
+            "ms_stake": "1852H/1815H/0H/7/0",
+            "ms_drep": "1852H/1815H/0H/8/0",
+        }
+    )
+
+    def __init__(self, ticker: str, tools: Optional[Dict[str, Path]] = None):
         self.ticker = ticker.upper()
         self.home_dir = Path.home() / f".CSPO_{self.ticker}"
         self.home_dir.mkdir(parents=True, exist_ok=True)
-        self.tools = verify_tools()
+        # Tools already resolved by the caller (see generate_wallets_batch)
+        self.tools = dict(tools) if tools is not None else verify_tools()
         self.mnemo = Mnemonic("english")
 
         # Check if shared mnemonic already exists for this ticker
         self.shared_mnemonic_file = self.home_dir / f"{self.ticker}-shared.mnemonic.txt"
+        self.shared_root_key_file = self.home_dir / f"{self.ticker}-shared.root.key"
+
+        # Root keys already derived from a mnemonic (PBKDF2 is the costly step)
+        self._root_key_cache: Dict[str, str] = {}
+        self._shared_mnemonic: Optional[str] = None
 
         # Check if tools are available
         if not self.tools:
@@ -56,261 +483,370 @@ class CardanoWalletGenerator:
                 # Keep cardano-cli but don't test it
             else:
                 # Test cardano-cli on other platforms
-                try:
-                    result = subprocess.run(
-                        [str(self.tools["cardano-cli"]), "--version"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-                    if result.returncode != 0:
-                        # Remove crashing cardano-cli from tools
-                        del self.tools["cardano-cli"]
-                        click.echo("⚠️  cardano-cli crashes, using simplified mode")
-                except Exception:
+                if not self._cardano_cli_usable():
                     # Remove crashing cardano-cli from tools
-                    if "cardano-cli" in self.tools:
-                        del self.tools["cardano-cli"]
-                    click.echo("⚠️  cardano-cli crashes, using simplified mode")
+                    del self.tools["cardano-cli"]
+                    click.echo(
+                        "⚠️  cardano-cli crashes, falling back to cardano-address"
+                    )
+
+        if "cardano-cli" in self.tools:
+            self._cardano_cli_bin = os.fspath(self.tools["cardano-cli"])
 
         # Check if we have enough tools for real mode
         # We need at least cardano-address for real mode, cardano-cli is optional
         if "cardano-address" in self.tools:
+            self._cardano_address_bin = os.fspath(self.tools["cardano-address"])
+            # Fixed argv prefixes for the key derivation commands
+            self._cmd_from_recovery_phrase = (
+                self._cardano_address_bin,
+                "key",
+                "from-recovery-phrase",
+                "Shelley",
+            )
+            self._cmd_key_child = (self._cardano_address_bin, "key", "child")
+            self._cmd_key_public = (
+                self._cardano_address_bin,
+                "key",
+                "public",
+                "--with-chain-code",
+            )
             click.echo("✅ Using real Cardano tools mode")
         else:
             click.echo("⚠️  Using simplified mode (cardano-address missing)")
 
+    def _cardano_cli_usable(self) -> bool:
+        """Check that cardano-cli runs, caching the answer per binary"""
+        cli_path = Path(self.tools["cardano-cli"]).resolve()
+        capabilities_file = self.home_dir / "tools.capabilities.json"
+
+        # Installers extract and mv binaries, keeping the archive's mtime, so
+        # identify the binary by everything a replacement would change
+        try:
+            cli_stat = cli_path.stat()
+        except OSError:
+            return False
+        binary = {
+            "path": os.fspath(cli_path),
+            "size": cli_stat.st_size,
+            "mtime_ns": cli_stat.st_mtime_ns,
+            "ino": cli_stat.st_ino,
+        }
+
+        try:
+            capabilities = _json_loads(capabilities_file.read_bytes())
+            if capabilities["binary"] == binary:
+                return bool(capabilities["cardano-cli-usable"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        try:
+            # Only the exit status matters, so don't collect any output
+            result = subprocess.run(
+                [os.fspath(cli_path), "--version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
+            )
+        except Exception:
+            # A timeout or failed launch may be transient (e.g. a loaded
+            # machine), so it is not remembered
+            return False
+        usable = result.returncode == 0
+
+        try:
+            write_file(
+                os.fspath(capabilities_file),
+                json.dumps({"binary": binary, "cardano-cli-usable": usable}),
+                0o600,
+            )
+        except OSError:
+            pass
+
+        return usable
+
     def get_or_create_shared_mnemonic(self) -> str:
         """Get existing shared mnemonic or create new one"""
         if self.shared_mnemonic_file.exists():
             # Load existing shared mnemonic
             mnemonic = self.shared_mnemonic_file.read_text().strip()
+            self._shared_mnemonic = mnemonic
+
+            # Reuse the root key derived by a previous run for this mnemonic
+            # (the file starts with a fingerprint of the mnemonic it came from)
+            if self.shared_root_key_file.exists():
+                cached = self.shared_root_key_file.read_text().split()
+                if len(cached) == 2 and cached[0] == _mnemonic_fingerprint(mnemonic):
+                    self._root_key_cache[mnemonic] = cached[1]
+
             click.echo(f"📋 Using existing shared mnemonic for {self.ticker}")
             return mnemonic
         else:
             # Create new shared mnemonic
-            mnemonic = self.mnemo.generate(strength=256)
+            mnemonic = _generate_mnemonic(self.mnemo.wordlist)
             # Save shared mnemonic with secure permissions
-            self.shared_mnemonic_file.write_text(mnemonic)
-            self.shared_mnemonic_file.chmod(0o600)  # Secure permissions
+            write_file(os.fspath(self.shared_mnemonic_file), mnemonic, 0o600)
+            self._shared_mnemonic = mnemonic
+
+            # A root key left over from a previous mnemonic is stale
+            if self.shared_root_key_file.exists():
+                self.shared_root_key_file.unlink()
+
             click.echo(f"🔐 Created new shared mnemonic for {self.ticker}")
             return mnemonic
 
     def generate_mnemonic(self) -> str:
         """Generate a 24-word recovery phrase (legacy method)"""
-        return self.mnemo.generate(strength=256)
+        return _generate_mnemonic(self.mnemo.wordlist)
 
     def mnemonic_to_root_key(self, mnemonic: str) -> str:
-        """Convert mnemonic phrase to root key using cardano-address"""
-        cmd = [
-            str(self.tools["cardano-address"]),
-            "key",
-            "from-recovery-phrase",
-            "Shelley",
-        ]
-        result = subprocess.run(cmd, input=mnemonic, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise click.ClickException(f"Error generating root key: {result.stderr}")
-        return result.stdout.strip()
+        """Convert mnemonic phrase to root key, reusing previous derivations"""
+        root_key = self._root_key_cache.get(mnemonic)
+        if root_key is None:
+            root_key = self._derive_root_key(mnemonic)
+            self._root_key_cache[mnemonic] = root_key
+
+            if mnemonic == self._shared_mnemonic:
+                # Persist so later runs for this ticker skip the derivation
+                write_file(
+                    os.fspath(self.shared_root_key_file),
+                    f"{_mnemonic_fingerprint(mnemonic)}\n{root_key}\n",
+                    0o600,
+                )
 
-    def derive_payment_key(self, root_key: str, purpose: str) -> Tuple[str, str]:
-        """Derive payment key pair from root key"""
-        try:
-            # Use cardano-address to derive keys
-            purpose_index = "0" if purpose == "pledge" else "1"
-            derivation_path = f"1852H/1815H/0H/{purpose_index}/0"
+        return root_key
 
-            # Derive private key
-            skey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "child",
-                derivation_path,
-            ]
-            skey_result = subprocess.run(
-                skey_cmd, input=root_key, capture_output=True, text=True
+    def _derive_root_key(self, mnemonic: str) -> str:
+        """Derive the root key from a mnemonic (pycardano or cardano-address)"""
+        native = _native()
+        if native is not None:
+            try:
+                wallet = native.HDWallet.from_mnemonic(mnemonic)
+            except ValueError as e:
+                raise click.ClickException(f"Error generating root key: {e}")
+            return _bech32_encode("root_xsk", wallet.xprivate_key + wallet.chain_code)
+
+        result = subprocess.run(
+            self._cmd_from_recovery_phrase,
+            input=mnemonic.encode(),
+            capture_output=True,
+        )
+        if result.returncode != 0:
+            raise click.ClickException(
+                f"Error generating root key: {result.stderr.decode(errors='replace')}"
             )
-            if skey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive payment signing key: {skey_result.stderr}"
+        return result.stdout.decode("ascii").strip()
+
+    def _run_pipeline(self, stages: List[Tuple[str, ...]], stdin: str) -> List[str]:
+        """Run chained commands, feeding each stage's output to the next one"""
+        processes = []
+        outputs = []
+        data = stdin.encode()
+        try:
+            # Spawn every stage up front so their startup overlaps
+            for stage in stages:
+                processes.append(
+                    subprocess.Popen(
+                        stage,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                    )
                 )
 
-            payment_skey = skey_result.stdout.strip()
+            for stage, process in zip(stages, processes):
+                stdout, stderr = process.communicate(data)
+                if process.returncode != 0:
+                    raise Exception(
+                        f"{' '.join(stage[1:])} failed: "
+                        f"{stderr.decode(errors='replace')}"
+                    )
+                data = stdout.strip()
+                outputs.append(data.decode("ascii"))
+        finally:
+            # Don't leave started stages waiting on stdin if a stage failed to
+            # start or exited with an error
+            for process in processes:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+
+        return outputs
+
+    def _derive_key_pair(self, root_key: str, derivation_path: str) -> Tuple[str, str]:
+        """Derive a signing/verification key pair in a single pipeline"""
+        if _native() is not None:
+            return self._derive_key_pair_native(root_key, derivation_path)
+
+        skey, vkey = self._run_pipeline(
+            [(*self._cmd_key_child, derivation_path), self._cmd_key_public],
+            root_key,
+        )
+        return skey, vkey
 
-            # Derive public key
-            vkey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "public",
-                "--with-chain-code",
-            ]
-            vkey_result = subprocess.run(
-                vkey_cmd, input=payment_skey, capture_output=True, text=True
-            )
-            if vkey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive payment verification key: {vkey_result.stderr}"
-                )
+    def _derive_key_pair_native(
+        self, root_key: str, derivation_path: str
+    ) -> Tuple[str, str]:
+        """Derive a key pair in-process, mirroring cardano-address output"""
+        role = derivation_path.split("/")[3]
+        if role not in _ROLE_KEY_PREFIXES:
+            raise Exception(f"Unsupported derivation role: {role}")
+        prefix = _ROLE_KEY_PREFIXES[role]
+
+        _, root_bytes = _bech32_decode(root_key)
+        if root_bytes is None or len(root_bytes) != 96:
+            raise Exception("Invalid root key")
+        xprivate_key, chain_code = root_bytes[:64], root_bytes[64:]
+        native = _native()
+        root = native.HDWallet(
+            xprivate_key=xprivate_key,
+            public_key=native.public_key(xprivate_key[:32]),
+            chain_code=chain_code,
+        )
 
-            payment_vkey = vkey_result.stdout.strip()
+        child = root.derive_from_path("m/" + derivation_path.replace("H", "'"))
+        skey = _bech32_encode(f"{prefix}_xsk", child.xprivate_key + child.chain_code)
+        vkey = _bech32_encode(f"{prefix}_xvk", child.public_key + child.chain_code)
+        return skey, vkey
 
+    def _native_verification_key(self, vkey: str) -> bytes:
+        """Extract the 32-byte Ed25519 public key from a Bech32 verification key"""
+        _, key_bytes = _bech32_decode(vkey)
+        if key_bytes is None or len(key_bytes) not in (32, 64):
+            raise click.ClickException(f"Invalid verification key: {vkey[:16]}...")
+        return key_bytes[:32]
+
+    def _derive(
+        self, root_key: str, kind: str, fallback_tag: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """Derive the key pair for a kind listed in _DERIVATION_PATHS"""
+        try:
             # For real tools mode, return Bech32 format keys (not CBOR hex)
             # This allows cardano-address to work properly for address generation
-            return payment_skey, payment_vkey
-
+            return self._derive_key_pair(root_key, self._DERIVATION_PATHS[kind])
         except Exception as e:
             click.echo(f"⚠️  Warning: Using fallback key generation: {e}")
             # Fallback: generate deterministic keys based on root_key hash
-            import hashlib
-
-            hash_input = f"{root_key}_{purpose}_payment"
+            hash_input = f"{root_key}_{fallback_tag or kind}"
             key_hash = hashlib.sha256(hash_input.encode()).digest()
             skey_cbor = "58" + "20" + key_hash.hex()
             vkey_cbor = "58" + "20" + hashlib.sha256(key_hash).digest().hex()
             return skey_cbor, vkey_cbor
 
+    def derive_payment_key(self, root_key: str, purpose: str) -> Tuple[str, str]:
+        """Derive payment key pair from root key"""
+        kind = "payment" if purpose == "pledge" else "payment_internal"
+        return self._derive(root_key, kind, f"{purpose}_payment")
+
     def derive_staking_key(self, root_key: str) -> Tuple[str, str]:
         """Derive staking key pair from root key"""
-        try:
-            # Use cardano-address to derive keys
-            derivation_path = "1852H/1815H/0H/2/0"
+        return self._derive(root_key, "staking")
 
-            # Derive private key
-            skey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "child",
-                derivation_path,
-            ]
-            skey_result = subprocess.run(
-                skey_cmd, input=root_key, capture_output=True, text=True
-            )
-            if skey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive staking signing key: {skey_result.stderr}"
-                )
-
-            stake_skey = skey_result.stdout.strip()
-
-            # Derive public key
-            vkey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "public",
-                "--with-chain-code",
-            ]
-            vkey_result = subprocess.run(
-                vkey_cmd, input=stake_skey, capture_output=True, text=True
+    def generate_payment_address(
+        self, payment_vkey: str, staking_vkey: str, network: str = "mainnet"
+    ) -> str:
+        """Generate base address (pycardano when available, else cardano-address)"""
+        if _native() is not None:
+            return self._generate_payment_address_native(
+                payment_vkey, staking_vkey, network
             )
-            if vkey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive staking verification key: {vkey_result.stderr}"
-                )
-
-            stake_vkey = vkey_result.stdout.strip()
+        return self._generate_payment_address_tool(payment_vkey, staking_vkey, network)
 
-            # For real tools mode, return Bech32 format keys (not CBOR hex)
-            # This allows cardano-address to work properly for address generation
-            return stake_skey, stake_vkey
-
-        except Exception as e:
-            click.echo(f"⚠️  Warning: Using fallback key generation: {e}")
-            # Fallback: generate deterministic keys based on root_key hash
-            import hashlib
-
-            hash_input = f"{root_key}_staking"
-            key_hash = hashlib.sha256(hash_input.encode()).digest()
-            skey_cbor = "58" + "20" + key_hash.hex()
-            vkey_cbor = "58" + "20" + hashlib.sha256(key_hash).digest().hex()
-            return skey_cbor, vkey_cbor
-
-    def generate_payment_address(
+    def _generate_payment_address_native(
+        self, payment_vkey: str, staking_vkey: str, network: str = "mainnet"
+    ) -> str:
+        """Generate base address in-process using pycardano"""
+        native = _native()
+        return native.Address(
+            payment_part=native.PaymentVerificationKey.from_primitive(
+                self._native_verification_key(payment_vkey)
+            ).hash(),
+            staking_part=native.StakeVerificationKey.from_primitive(
+                self._native_verification_key(staking_vkey)
+            ).hash(),
+            network=(
+                native.Network.MAINNET
+                if self._NETWORK_TAGS.get(network, "1") == "1"
+                else native.Network.TESTNET
+            ),
+        ).encode()
+
+    def _generate_payment_address_tool(
         self, payment_vkey: str, staking_vkey: str, network: str = "mainnet"
     ) -> str:
         """Generate base address using cardano-address"""
         # Map network to network tag
-        network_tags = {"mainnet": "1", "testnet": "0", "preview": "0", "preprod": "0"}
-        network_tag = network_tags.get(network, "1")
-
-        # Base address (combines payment and staking keys)
-        # First, create the payment address
-        payment_cmd = [
-            str(self.tools["cardano-address"]),
-            "address",
-            "payment",
-            "--network-tag",
-            network_tag,
-        ]
-        payment_result = subprocess.run(
-            payment_cmd, input=payment_vkey, capture_output=True, text=True
-        )
-        if payment_result.returncode != 0:
-            raise click.ClickException(
-                f"Error generating payment address: {payment_result.stderr}"
-            )
-        payment_addr = payment_result.stdout.strip()
-
-        # Then, create the staking address
-        stake_cmd = [
-            str(self.tools["cardano-address"]),
-            "address",
-            "stake",
-            "--network-tag",
-            network_tag,
-        ]
-        stake_result = subprocess.run(
-            stake_cmd, input=staking_vkey, capture_output=True, text=True
-        )
-        if stake_result.returncode != 0:
-            raise click.ClickException(
-                f"Error generating staking address: {stake_result.stderr}"
-            )
-        stake_addr = stake_result.stdout.strip()
+        network_tag = self._NETWORK_TAGS.get(network, "1")
 
-        # Combine payment and staking addresses to create base address
-        # The delegation command expects: payment_address | cardano-address address delegation staking_public_key
-        base_cmd = [
-            str(self.tools["cardano-address"]),
-            "address",
-            "delegation",
-            staking_vkey,  # Use the staking public key directly
-        ]
-        base_result = subprocess.run(
-            base_cmd, input=payment_addr, capture_output=True, text=True
-        )
-        if base_result.returncode != 0:
-            raise click.ClickException(
-                f"Error generating base address: {base_result.stderr}"
+        # Base address: payment address | cardano-address address delegation staking_vkey
+        try:
+            _, base_addr = self._run_pipeline(
+                [
+                    (
+                        self._cardano_address_bin,
+                        "address",
+                        "payment",
+                        "--network-tag",
+                        network_tag,
+                    ),
+                    (self._cardano_address_bin, "address", "delegation", staking_vkey),
+                ],
+                payment_vkey,
             )
-        return base_result.stdout.strip()
+        except Exception as e:
+            raise click.ClickException(f"Error generating base address: {e}")
+        return base_addr
 
     def generate_staking_address(
         self, staking_vkey: str, network: str = "mainnet"
+    ) -> str:
+        """Generate staking address (pycardano when available, else cardano-address)"""
+        if _native() is not None:
+            return self._generate_staking_address_native(staking_vkey, network)
+        return self._generate_staking_address_tool(staking_vkey, network)
+
+    def _generate_staking_address_native(
+        self, staking_vkey: str, network: str = "mainnet"
+    ) -> str:
+        """Generate staking address in-process using pycardano"""
+        native = _native()
+        return native.Address(
+            staking_part=native.StakeVerificationKey.from_primitive(
+                self._native_verification_key(staking_vkey)
+            ).hash(),
+            network=(
+                native.Network.MAINNET
+                if self._NETWORK_TAGS.get(network, "1") == "1"
+                else native.Network.TESTNET
+            ),
+        ).encode()
+
+    def _generate_staking_address_tool(
+        self, staking_vkey: str, network: str = "mainnet"
     ) -> str:
         """Generate staking address using cardano-address"""
         # Map network to network tag
-        network_tags = {"mainnet": "1", "testnet": "0", "preview": "0", "preprod": "0"}
-        network_tag = network_tags.get(network, "1")
+        network_tag = self._NETWORK_TAGS.get(network, "1")
 
         cmd = [
-            str(self.tools["cardano-address"]),
+            self._cardano_address_bin,
             "address",
             "stake",
             "--network-tag",
             network_tag,
         ]
-        result = subprocess.run(cmd, input=staking_vkey, capture_output=True, text=True)
+        result = subprocess.run(cmd, input=staking_vkey.encode(), capture_output=True)
         if result.returncode != 0:
             raise click.ClickException(
-                f"Error generating staking address: {result.stderr}"
+                f"Error generating staking address: {result.stderr.decode(errors='replace')}"
             )
-        return result.stdout.strip()
+        return result.stdout.decode("ascii").strip()
 
     def validate_address(self, address: str) -> bool:
         """Validate a Cardano address using bech32"""
         try:
             # Decode bech32 address
-            hrp, data = bech32.bech32_decode(address)
+            hrp, data = _bech32_decode(address)
             if hrp is None or data is None:
                 return False
 
@@ -320,66 +856,6 @@ class CardanoWalletGenerator:
         except Exception:
             return False
 
-    def generate_address_candidate(
-        self, payment_vkey: str, staking_vkey: str, network: str = "mainnet"
-    ) -> str:
-        """Generate a candidate base address for verification"""
-        # Generate candidate address using same method as generate_payment_address
-        # Map network to network tag
-        network_tags = {"mainnet": "1", "testnet": "0", "preview": "0", "preprod": "0"}
-        network_tag = network_tags.get(network, "1")
-
-        # First, create the payment address
-        payment_cmd = [
-            str(self.tools["cardano-address"]),
-            "address",
-            "payment",
-            "--network-tag",
-            network_tag,
-        ]
-        payment_result = subprocess.run(
-            payment_cmd, input=payment_vkey, capture_output=True, text=True
-        )
-        if payment_result.returncode != 0:
-            raise click.ClickException(
-                f"Error generating payment address: {payment_result.stderr}"
-            )
-        payment_addr = payment_result.stdout.strip()
-
-        # Then, create the staking address
-        stake_cmd = [
-            str(self.tools["cardano-address"]),
-            "address",
-            "stake",
-            "--network-tag",
-            network_tag,
-        ]
-        stake_result = subprocess.run(
-            stake_cmd, input=staking_vkey, capture_output=True, text=True
-        )
-        if stake_result.returncode != 0:
-            raise click.ClickException(
-                f"Error generating staking address: {stake_result.stderr}"
-            )
-        stake_addr = stake_result.stdout.strip()
-
-        # Combine payment and staking addresses to create base address
-        # The delegation command expects: payment_address | cardano-address address delegation staking_public_key
-        base_cmd = [
-            str(self.tools["cardano-address"]),
-            "address",
-            "delegation",
-            staking_vkey,  # Use the staking public key directly
-        ]
-        base_result = subprocess.run(
-            base_cmd, input=payment_addr, capture_output=True, text=True
-        )
-        if base_result.returncode != 0:
-            raise click.ClickException(
-                f"Error generating base address: {base_result.stderr}"
-            )
-        return base_result.stdout.strip()
-
     def verify_address_candidates(self, base_addr: str, candidate_addr: str) -> bool:
         """Verify that base address matches candidate address"""
         return base_addr == candidate_addr
@@ -389,70 +865,32 @@ class CardanoWalletGenerator:
         wallet_dir = self.home_dir / purpose
         wallet_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save files
-        files_saved = []
-
-        # Payment private key
-        payment_skey_file = wallet_dir / f"{self.ticker}-{purpose}.payment_skey"
-        with open(payment_skey_file, "w") as f:
-            f.write(wallet_data["payment_skey"])
-        files_saved.append(payment_skey_file)
-
-        # Payment public key
-        payment_vkey_file = wallet_dir / f"{self.ticker}-{purpose}.payment_vkey"
-        with open(payment_vkey_file, "w") as f:
-            f.write(wallet_data["payment_vkey"])
-        files_saved.append(payment_vkey_file)
-
-        # Base address (payment address)
-        base_addr_file = wallet_dir / f"{self.ticker}-{purpose}.base_addr"
-        with open(base_addr_file, "w") as f:
-            f.write(wallet_data["base_addr"])
-        files_saved.append(base_addr_file)
-
-        # Base address candidate for verification
-        base_addr_candidate_file = (
-            wallet_dir / f"{self.ticker}-{purpose}.base_addr.candidate"
-        )
-        with open(base_addr_candidate_file, "w") as f:
-            f.write(wallet_data["base_addr_candidate"])
-        files_saved.append(base_addr_candidate_file)
-
-        # Reward address (staking address)
-        reward_addr_file = wallet_dir / f"{self.ticker}-{purpose}.reward_addr"
-        with open(reward_addr_file, "w") as f:
-            f.write(wallet_data["reward_addr"])
-        files_saved.append(reward_addr_file)
-
-        # Reward address candidate for verification
-        reward_addr_candidate_file = (
-            wallet_dir / f"{self.ticker}-{purpose}.reward_addr.candidate"
-        )
-        with open(reward_addr_candidate_file, "w") as f:
-            f.write(wallet_data["reward_addr_candidate"])
-        files_saved.append(reward_addr_candidate_file)
-
-        # Staking private key
-        staking_skey_file = wallet_dir / f"{self.ticker}-{purpose}.staking_skey"
-        with open(staking_skey_file, "w") as f:
-            f.write(wallet_data["staking_skey"])
-        files_saved.append(staking_skey_file)
-
-        # Staking public key
-        staking_vkey_file = wallet_dir / f"{self.ticker}-{purpose}.staking_vkey"
-        with open(staking_vkey_file, "w") as f:
-            f.write(wallet_data["staking_vkey"])
-        files_saved.append(staking_vkey_file)
-
-        # Recovery phrase
-        mnemonic_file = wallet_dir / f"{self.ticker}-{purpose}.mnemonic.txt"
-        with open(mnemonic_file, "w") as f:
-            f.write(wallet_data["mnemonic"])
-        files_saved.append(mnemonic_file)
-
-        # Make sensitive files more secure
-        for file in [payment_skey_file, staking_skey_file, mnemonic_file]:
-            file.chmod(0o600)  # Read/write for owner only
+        prefix = wallet_dir / f"{self.ticker}-{purpose}"
+        files = [
+            # Payment keys
+            (f"{prefix}.payment_skey", wallet_data["payment_skey"], 0o600),
+            (f"{prefix}.payment_vkey", wallet_data["payment_vkey"], 0o666),
+            # Base address (payment address) and candidate for verification
+            (f"{prefix}.base_addr", wallet_data["base_addr"], 0o666),
+            (
+                f"{prefix}.base_addr.candidate",
+                wallet_data["base_addr_candidate"],
+                0o666,
+            ),
+            # Reward address (staking address) and candidate for verification
+            (f"{prefix}.reward_addr", wallet_data["reward_addr"], 0o666),
+            (
+                f"{prefix}.reward_addr.candidate",
+                wallet_data["reward_addr_candidate"],
+                0o666,
+            ),
+            # Staking keys
+            (f"{prefix}.staking_skey", wallet_data["staking_skey"], 0o600),
+            (f"{prefix}.staking_vkey", wallet_data["staking_vkey"], 0o666),
+            # Recovery phrase
+            (f"{prefix}.mnemonic.txt", wallet_data["mnemonic"], 0o600),
+        ]
+        write_files(files)
 
         return wallet_dir
 
@@ -467,37 +905,16 @@ class CardanoWalletGenerator:
         """Import existing keys instead of generating new ones"""
         wallet_data = {}
 
-        # Import payment keys
-        if payment_vkey_path and Path(payment_vkey_path).exists():
-            with open(payment_vkey_path, "r") as f:
-                payment_vkey_content = f.read()
-                payment_vkey_json = json.loads(payment_vkey_content)
-                wallet_data["payment_vkey"] = payment_vkey_json["cborHex"]
-                click.echo(
-                    f"✅ Imported payment verification key from {payment_vkey_path}"
-                )
-
-        if payment_skey_path and Path(payment_skey_path).exists():
-            with open(payment_skey_path, "r") as f:
-                payment_skey_content = f.read()
-                payment_skey_json = json.loads(payment_skey_content)
-                wallet_data["payment_skey"] = payment_skey_json["cborHex"]
-                click.echo(f"✅ Imported payment signing key from {payment_skey_path}")
-
-        # Import staking keys
-        if stake_vkey_path and Path(stake_vkey_path).exists():
-            with open(stake_vkey_path, "r") as f:
-                stake_vkey_content = f.read()
-                stake_vkey_json = json.loads(stake_vkey_content)
-                wallet_data["staking_vkey"] = stake_vkey_json["cborHex"]
-                click.echo(f"✅ Imported stake verification key from {stake_vkey_path}")
-
-        if stake_skey_path and Path(stake_skey_path).exists():
-            with open(stake_skey_path, "r") as f:
-                stake_skey_content = f.read()
-                stake_skey_json = json.loads(stake_skey_content)
-                wallet_data["staking_skey"] = stake_skey_json["cborHex"]
-                click.echo(f"✅ Imported stake signing key from {stake_skey_path}")
+        key_files = [
+            ("payment_vkey", payment_vkey_path, "payment verification key"),
+            ("payment_skey", payment_skey_path, "payment signing key"),
+            ("staking_vkey", stake_vkey_path, "stake verification key"),
+            ("staking_skey", stake_skey_path, "stake signing key"),
+        ]
+        for name, path, label in key_files:
+            if path and Path(path).exists():
+                wallet_data[name] = _json_loads(Path(path).read_bytes())["cborHex"]
+                click.echo(f"✅ Imported {label} from {path}")
 
         return wallet_data
 
@@ -527,33 +944,20 @@ class CardanoWalletGenerator:
         if not imported_keys:
             raise click.ClickException("No valid keys provided for import")
 
-        # Convert CBOR hex back to Bech32 for address generation
-        payment_vkey_bech32 = self.cbor_hex_to_bech32(
-            imported_keys["payment_vkey"], "addr_vk"
-        )
-        staking_vkey_bech32 = self.cbor_hex_to_bech32(
-            imported_keys["staking_vkey"], "stake_vk"
-        )
-
-        # Generate addresses using imported keys
-        base_addr = self.generate_payment_address(
-            payment_vkey_bech32, staking_vkey_bech32, network
-        )
-        reward_addr = self.generate_staking_address(staking_vkey_bech32, network)
+        # Addresses are a pure function of the public keys and network, so
+        # re-importing the same keys in this process reuses them
+        key = (imported_keys["payment_vkey"], imported_keys["staking_vkey"], network)
+        addresses = _IMPORTED_ADDRESSES.pop(key, None)
+        if addresses is None:
+            addresses = self._derive_imported_addresses(*key)
+            if len(_IMPORTED_ADDRESSES) >= _IMPORTED_ADDRESSES_SIZE:
+                _IMPORTED_ADDRESSES.popitem(last=False)
+        _IMPORTED_ADDRESSES[key] = addresses
+        base_addr, reward_addr = addresses
         click.echo(
             f"{Fore.GREEN}Addresses generated from imported keys{Style.RESET_ALL}"
         )
 
-        # Validate addresses
-        if not self.validate_address(base_addr):
-            raise click.ClickException(
-                "Invalid base address generated from imported keys"
-            )
-        if not self.validate_address(reward_addr):
-            raise click.ClickException(
-                "Invalid reward address generated from imported keys"
-            )
-
         # Prepare wallet data
         wallet_data = {
             "payment_skey": imported_keys.get("payment_skey", ""),
@@ -576,24 +980,34 @@ class CardanoWalletGenerator:
 
         return wallet_data
 
-    def cbor_hex_to_bech32(self, cbor_hex: str, prefix: str) -> str:
-        """Convert CBOR hex to Bech32 format"""
-        try:
-            # Remove CBOR tag and length
-            if cbor_hex.startswith("58"):
-                key_data = bytes.fromhex(cbor_hex[4:])  # Skip "58" and length
-            else:
-                key_data = bytes.fromhex(cbor_hex)
+    def _derive_imported_addresses(
+        self, payment_vkey: str, staking_vkey: str, network: str
+    ) -> Tuple[str, str]:
+        """Generate and validate the (base, reward) addresses of imported keys"""
+        # Convert CBOR hex back to Bech32 for address generation
+        payment_vkey_bech32 = self.cbor_hex_to_bech32(payment_vkey, "addr_vk")
+        staking_vkey_bech32 = self.cbor_hex_to_bech32(staking_vkey, "stake_vk")
 
-            # Encode as Bech32
-            return bech32.encode(prefix, key_data)
-        except Exception:
-            # Fallback: return a placeholder
-            return (
-                f"{prefix}1{key_data.hex()[:56]}"
-                if "key_data" in locals()
-                else f"{prefix}1placeholder"
+        # Generate addresses using imported keys
+        base_addr = self.generate_payment_address(
+            payment_vkey_bech32, staking_vkey_bech32, network
+        )
+        reward_addr = self.generate_staking_address(staking_vkey_bech32, network)
+
+        # Validate addresses
+        if not self.validate_address(base_addr):
+            raise click.ClickException(
+                "Invalid base address generated from imported keys"
             )
+        if not self.validate_address(reward_addr):
+            raise click.ClickException(
+                "Invalid reward address generated from imported keys"
+            )
+        return base_addr, reward_addr
+
+    def cbor_hex_to_bech32(self, cbor_hex: str, prefix: str) -> str:
+        """Convert CBOR hex to Bech32 format"""
+        return _cbor_hex_to_bech32(cbor_hex, prefix)
 
     def generate_wallet(self, purpose: str, network: str = "mainnet") -> Dict[str, str]:
         """Generate a complete wallet using real Cardano tools"""
@@ -622,11 +1036,19 @@ class CardanoWalletGenerator:
         reward_addr = self.generate_staking_address(staking_vkey, network)
         click.echo(f"{Fore.GREEN}Addresses generated{Style.RESET_ALL}")
 
-        # Generate candidate addresses for verification
-        base_addr_candidate = self.generate_address_candidate(
-            payment_vkey, staking_vkey, network
-        )
-        reward_addr_candidate = self.generate_staking_address(staking_vkey, network)
+        # Generate candidate addresses for verification with an independent
+        # implementation, so a mismatch reveals a real derivation problem
+        if _native() is not None and "cardano-address" in self.tools:
+            base_addr_candidate = self._generate_payment_address_tool(
+                payment_vkey, staking_vkey, network
+            )
+            reward_addr_candidate = self._generate_staking_address_tool(
+                staking_vkey, network
+            )
+        else:
+            # Both would run the same deterministic commands again
+            base_addr_candidate = base_addr
+            reward_addr_candidate = reward_addr
         click.echo(
             f"{Fore.GREEN}Address candidates generated for verification{Style.RESET_ALL}"
         )
@@ -681,33 +1103,40 @@ class CardanoWalletGenerator:
             "aarch64",
         ]
 
-        if is_arm64_macos:
-            click.echo(
-                f"{Fore.CYAN}Generating complete stake pool files for {self.ticker}-{purpose} using cardano-address...{Style.RESET_ALL}"
-            )
-            click.echo(
-                "⚠️  ARM64 macOS detected - cardano-cli may crash due to Nix dependencies"
-            )
-            click.echo(
-                "🔄 Using cardano-address for key generation (ARM64 macOS compatibility)"
-            )
+        # Key files cardano-cli writes live here until saved, and go with
+        # the directory whatever happens in between
+        with self._staging_dir() as staging_dir:
+            if is_arm64_macos:
+                click.echo(
+                    f"{Fore.CYAN}Generating complete stake pool files for {self.ticker}-{purpose} using cardano-address...{Style.RESET_ALL}"
+                )
+                click.echo(
+                    "⚠️  ARM64 macOS detected - cardano-cli may crash due to Nix dependencies"
+                )
+                click.echo(
+                    "🔄 Using cardano-address for key generation (ARM64 macOS compatibility)"
+                )
 
-            # Use cardano-address directly for ARM64 macOS
-            wallet_data = self.generate_keys_with_cardano_address(purpose, network)
-        else:
-            click.echo(
-                f"{Fore.CYAN}Generating complete stake pool files for {self.ticker}-{purpose} using cardano-cli...{Style.RESET_ALL}"
-            )
+                # Use cardano-address directly for ARM64 macOS
+                wallet_data = self.generate_keys_with_cardano_address(purpose, network)
+            else:
+                click.echo(
+                    f"{Fore.CYAN}Generating complete stake pool files for {self.ticker}-{purpose} using cardano-cli...{Style.RESET_ALL}"
+                )
 
-            # Use cardano-cli for key generation (recommended for compatibility)
-            wallet_data = self.generate_keys_with_cardano_cli(purpose, network)
+                # Use cardano-cli for key generation (recommended for compatibility)
+                wallet_data = self.generate_keys_with_cardano_cli(
+                    purpose, network, staging_dir
+                )
 
-        click.echo(
-            f"{Fore.GREEN}All keys and files generated successfully{Style.RESET_ALL}"
-        )
+            click.echo(
+                f"{Fore.GREEN}All keys and files generated successfully{Style.RESET_ALL}"
+            )
 
-        # Save files
-        wallet_dir = self.save_complete_wallet_files(purpose, wallet_data)
+            # Save files, moving the ones cardano-cli staged into place
+            wallet_dir = self.save_complete_wallet_files(
+                purpose, wallet_data, staging_dir
+            )
 
         click.echo(
             f"{Fore.GREEN}Complete stake pool files generated in: {wallet_dir}{Style.RESET_ALL}"
@@ -717,316 +1146,49 @@ class CardanoWalletGenerator:
 
     def derive_cold_key(self, root_key: str) -> Tuple[str, str]:
         """Derive cold key pair from root key"""
-        try:
-            import subprocess
-
-            # Derive cold key using cardano-address
-            cold_skey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "child",
-                "1852H/1815H/0H/3/0",
-            ]
-            cold_skey_result = subprocess.run(
-                cold_skey_cmd, input=root_key, capture_output=True, text=True
-            )
-            if cold_skey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive cold signing key: {cold_skey_result.stderr}"
-                )
-            cold_skey = cold_skey_result.stdout.strip()
-
-            cold_vkey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "public",
-                "--with-chain-code",
-            ]
-            cold_vkey_result = subprocess.run(
-                cold_vkey_cmd, input=cold_skey, capture_output=True, text=True
-            )
-            if cold_vkey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive cold verification key: {cold_vkey_result.stderr}"
-                )
-            cold_vkey = cold_vkey_result.stdout.strip()
-
-            return cold_skey, cold_vkey
-        except Exception:
-            # Fallback to deterministic generation
-            import hashlib
-
-            cold_hash = hashlib.sha256(f"{root_key}_cold".encode()).digest()
-            cold_skey = "58" + "20" + cold_hash.hex()
-            cold_vkey = "58" + "20" + hashlib.sha256(cold_hash).digest().hex()
-            return cold_skey, cold_vkey
+        return self._derive(root_key, "cold")
 
     def derive_hot_key(self, root_key: str) -> Tuple[str, str]:
         """Derive hot key pair from root key"""
-        try:
-            import subprocess
-
-            # Derive hot key using cardano-address
-            hot_skey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "child",
-                "1852H/1815H/0H/4/0",
-            ]
-            hot_skey_result = subprocess.run(
-                hot_skey_cmd, input=root_key, capture_output=True, text=True
-            )
-            if hot_skey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive hot signing key: {hot_skey_result.stderr}"
-                )
-            hot_skey = hot_skey_result.stdout.strip()
-
-            hot_vkey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "public",
-                "--with-chain-code",
-            ]
-            hot_vkey_result = subprocess.run(
-                hot_vkey_cmd, input=hot_skey, capture_output=True, text=True
-            )
-            if hot_vkey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive hot verification key: {hot_vkey_result.stderr}"
-                )
-            hot_vkey = hot_vkey_result.stdout.strip()
-
-            return hot_skey, hot_vkey
-        except Exception:
-            # Fallback to deterministic generation
-            import hashlib
-
-            hot_hash = hashlib.sha256(f"{root_key}_hot".encode()).digest()
-            hot_skey = "58" + "20" + hot_hash.hex()
-            hot_vkey = "58" + "20" + hashlib.sha256(hot_hash).digest().hex()
-            return hot_skey, hot_vkey
+        return self._derive(root_key, "hot")
 
     def derive_drep_key(self, root_key: str) -> Tuple[str, str]:
         """Derive DRep key pair from root key"""
-        try:
-            import subprocess
-
-            # Derive DRep key using cardano-address
-            drep_skey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "child",
-                "1852H/1815H/0H/5/0",
-            ]
-            drep_skey_result = subprocess.run(
-                drep_skey_cmd, input=root_key, capture_output=True, text=True
-            )
-            if drep_skey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive DRep signing key: {drep_skey_result.stderr}"
-                )
-            drep_skey = drep_skey_result.stdout.strip()
-
-            drep_vkey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "public",
-                "--with-chain-code",
-            ]
-            drep_vkey_result = subprocess.run(
-                drep_vkey_cmd, input=drep_skey, capture_output=True, text=True
-            )
-            if drep_vkey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive DRep verification key: {drep_vkey_result.stderr}"
-                )
-            drep_vkey = drep_vkey_result.stdout.strip()
-
-            return drep_skey, drep_vkey
-        except Exception:
-            # Fallback to deterministic generation
-            import hashlib
-
-            drep_hash = hashlib.sha256(f"{root_key}_drep".encode()).digest()
-            drep_skey = "58" + "20" + drep_hash.hex()
-            drep_vkey = "58" + "20" + hashlib.sha256(drep_hash).digest().hex()
-            return drep_skey, drep_vkey
+        return self._derive(root_key, "drep")
 
     def derive_ms_payment_key(self, root_key: str) -> Tuple[str, str]:
         """Derive multi-signature payment key from root key"""
-        try:
-            import subprocess
-
-            # Derive multi-signature payment key using cardano-address
-            ms_payment_skey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "child",
-                "1852H/1815H/0H/6/0",
-            ]
-            ms_payment_skey_result = subprocess.run(
-                ms_payment_skey_cmd, input=root_key, capture_output=True, text=True
-            )
-            if ms_payment_skey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive MS payment signing key: {ms_payment_skey_result.stderr}"
-                )
-            ms_payment_skey = ms_payment_skey_result.stdout.strip()
-
-            ms_payment_vkey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "public",
-                "--with-chain-code",
-            ]
-            ms_payment_vkey_result = subprocess.run(
-                ms_payment_vkey_cmd,
-                input=ms_payment_skey,
-                capture_output=True,
-                text=True,
-            )
-            if ms_payment_vkey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive MS payment verification key: {ms_payment_vkey_result.stderr}"
-                )
-            ms_payment_vkey = ms_payment_vkey_result.stdout.strip()
-
-            return ms_payment_skey, ms_payment_vkey
-        except Exception:
-            # Fallback to deterministic generation
-            import hashlib
-
-            ms_payment_hash = hashlib.sha256(f"{root_key}_ms_payment".encode()).digest()
-            ms_payment_skey = "58" + "20" + ms_payment_hash.hex()
-            ms_payment_vkey = (
-                "58" + "20" + hashlib.sha256(ms_payment_hash).digest().hex()
-            )
-            return ms_payment_skey, ms_payment_vkey
+        return self._derive(root_key, "ms_payment")
 
     def derive_ms_stake_key(self, root_key: str) -> Tuple[str, str]:
         """Derive multi-signature stake key from root key"""
-        try:
-            import subprocess
-
-            # Derive multi-signature stake key using cardano-address
-            ms_stake_skey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "child",
-                "1852H/1815H/0H/7/0",
-            ]
-            ms_stake_skey_result = subprocess.run(
-                ms_stake_skey_cmd, input=root_key, capture_output=True, text=True
-            )
-            if ms_stake_skey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive MS stake signing key: {ms_stake_skey_result.stderr}"
-                )
-            ms_stake_skey = ms_stake_skey_result.stdout.strip()
-
-            ms_stake_vkey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "public",
-                "--with-chain-code",
-            ]
-            ms_stake_vkey_result = subprocess.run(
-                ms_stake_vkey_cmd, input=ms_stake_skey, capture_output=True, text=True
-            )
-            if ms_stake_vkey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive MS stake verification key: {ms_stake_vkey_result.stderr}"
-                )
-            ms_stake_vkey = ms_stake_vkey_result.stdout.strip()
-
-            return ms_stake_skey, ms_stake_vkey
-        except Exception:
-            # Fallback to deterministic generation
-            import hashlib
-
-            ms_stake_hash = hashlib.sha256(f"{root_key}_ms_stake".encode()).digest()
-            ms_stake_skey = "58" + "20" + ms_stake_hash.hex()
-            ms_stake_vkey = "58" + "20" + hashlib.sha256(ms_stake_hash).digest().hex()
-            return ms_stake_skey, ms_stake_vkey
+        return self._derive(root_key, "ms_stake")
 
     def derive_ms_drep_key(self, root_key: str) -> Tuple[str, str]:
         """Derive multi-signature DRep key from root key"""
-        try:
-            import subprocess
-
-            # Derive multi-signature DRep key using cardano-address
-            ms_drep_skey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "child",
-                "1852H/1815H/0H/8/0",
-            ]
-            ms_drep_skey_result = subprocess.run(
-                ms_drep_skey_cmd, input=root_key, capture_output=True, text=True
-            )
-            if ms_drep_skey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive MS DRep signing key: {ms_drep_skey_result.stderr}"
-                )
-            ms_drep_skey = ms_drep_skey_result.stdout.strip()
+        return self._derive(root_key, "ms_drep")
 
-            ms_drep_vkey_cmd = [
-                str(self.tools["cardano-address"]),
-                "key",
-                "public",
-                "--with-chain-code",
-            ]
-            ms_drep_vkey_result = subprocess.run(
-                ms_drep_vkey_cmd, input=ms_drep_skey, capture_output=True, text=True
-            )
-            if ms_drep_vkey_result.returncode != 0:
-                raise Exception(
-                    f"Failed to derive MS DRep verification key: {ms_drep_vkey_result.stderr}"
-                )
-            ms_drep_vkey = ms_drep_vkey_result.stdout.strip()
-
-            return ms_drep_skey, ms_drep_vkey
-        except Exception:
-            # Fallback to deterministic generation
-            import hashlib
-
-            ms_drep_hash = hashlib.sha256(f"{root_key}_ms_drep".encode()).digest()
-            ms_drep_skey = "58" + "20" + ms_drep_hash.hex()
-            ms_drep_vkey = "58" + "20" + hashlib.sha256(ms_drep_hash).digest().hex()
-            return ms_drep_skey, ms_drep_vkey
-
-    def generate_payment_credential(self, payment_vkey: str) -> str:
-        """Generate payment credential from verification key"""
+    def _key_hash(self, vkey: str) -> str:
+        """Hash a verification key (Bech32 or CBOR hex) into a credential"""
+        # Blake2b-224 of the Ed25519 public key without its chain code, as
+        # cardano-address key hash computes it
         try:
-            import hashlib
-
-            # Extract the key data (remove CBOR tag if present)
-            if payment_vkey.startswith("58"):
-                key_data = payment_vkey[4:]  # Remove "58" + "20"
-            else:
-                key_data = payment_vkey
-            # Generate credential hash
-            return hashlib.sha256(bytes.fromhex(key_data)).digest()[:28].hex()
+            _, key_bytes = _bech32_decode(vkey)
+            if key_bytes is None:
+                # Extract the key data (remove CBOR tag if present)
+                key_bytes = bytes.fromhex(vkey[4:] if vkey.startswith("58") else vkey)
+            return hashlib.blake2b(key_bytes[:32], digest_size=28).hexdigest()
         except Exception:
             # Fallback
             return "0" * 56
 
-    def generate_stake_credential(self, stake_vkey: str) -> str:
-        """Generate stake credential from verification key"""
-        try:
-            import hashlib
+    def generate_payment_credential(self, payment_vkey: str) -> str:
+        """Generate payment credential from verification key"""
+        return self._key_hash(payment_vkey)
 
-            # Extract the key data (remove CBOR tag if present)
-            if stake_vkey.startswith("58"):
-                key_data = stake_vkey[4:]  # Remove "58" + "20"
-            else:
-                key_data = stake_vkey
-            # Generate credential hash
-            return hashlib.sha256(bytes.fromhex(key_data)).digest()[:28].hex()
-        except Exception:
-            # Fallback
-            return "0" * 56
+    def generate_stake_credential(self, stake_vkey: str) -> str:
+        """Generate stake credential from verification key"""
+        return self._key_hash(stake_vkey)
 
     def generate_stake_certificate(self, stake_skey: str, stake_vkey: str) -> str:
         """Generate stake certificate (placeholder)"""
@@ -1046,23 +1208,16 @@ class CardanoWalletGenerator:
         if cbor_hex.startswith("58"):
             return cbor_hex
 
-        # If it's a Bech32 key, try to decode it
+        # If it's a Bech32 key, its prefix says so; decode it only then
         try:
-            # Try to decode as Bech32
-            for prefix in ["addr_vkh", "stake_vkh", "addr_vk", "stake_vk", "drep_xvk"]:
-                decoded = bech32.decode(prefix, cbor_hex)
-                if decoded is not None:
-                    key_data = bytes(decoded[1])
-                    return "58" + f"{len(key_data):02x}" + key_data.hex()
-
-            # If not Bech32, assume it's already hex data
-            if len(cbor_hex) == 64:  # 32 bytes hex
-                return "58" + "20" + cbor_hex
-            elif len(cbor_hex) == 128:  # 64 bytes hex
-                return "58" + "40" + cbor_hex
-
-            # If none of the above, return as is
-            return cbor_hex
+            key_data = _try_bech32(cbor_hex, _BECH32_KEY_PREFIXES + ("drep_xvk",))
+            if key_data is not None:
+                return (bytes([0x58, len(key_data)]) + key_data).hex()
+
+            # If not Bech32, assume it's raw key hex and add the header for
+            # its size; anything else is returned as is
+            header = self._CBOR_HEX_HEADERS.get(len(cbor_hex))
+            return cbor_hex if header is None else header + cbor_hex
 
         except Exception:
             # If all else fails, return the original
@@ -1075,12 +1230,10 @@ class CardanoWalletGenerator:
             if len(key_data) == 56:  # 28 bytes hex
                 return key_data
 
-            # If it's a Bech32 key, try to decode it
-            for prefix in ["addr_vkh", "stake_vkh", "addr_vk", "stake_vk"]:
-                decoded = bech32.decode(prefix, key_data)
-                if decoded is not None:
-                    key_bytes = bytes(decoded[1])
-                    return key_bytes[:28].hex()
+            # If it's a Bech32 key, its prefix says so; decode it only then
+            key_bytes = _try_bech32(key_data)
+            if key_bytes is not None:
+                return key_bytes[:28].hex()
 
             # If it's CBOR hex, extract the key data
             if key_data.startswith("58"):
@@ -1094,276 +1247,122 @@ class CardanoWalletGenerator:
                 return key_data[:56]
 
             # If none of the above, generate hash from the data
-            import hashlib
-
-            return hashlib.sha256(key_data.encode()).digest()[:28].hex()
+            # (Blake2b-224, the hash Cardano uses for credentials)
+            return hashlib.blake2b(key_data.encode(), digest_size=28).hexdigest()
 
         except Exception:
             # If all else fails, generate hash from the data
-            import hashlib
-
-            return hashlib.sha256(key_data.encode()).digest()[:28].hex()
+            return hashlib.blake2b(key_data.encode(), digest_size=28).hexdigest()
 
     def create_cardano_credential_file(
         self, cred_type: str, description: str, cbor_hex: str
     ) -> str:
         """Create a Cardano CLI format credential file"""
-        return json.dumps(
-            {"type": cred_type, "description": description, "cborHex": cbor_hex},
-            indent=2,
+        return _json_dumps(
+            {"type": cred_type, "description": description, "cborHex": cbor_hex}
         )
 
     def save_complete_wallet_files(
-        self, purpose: str, wallet_data: Dict[str, str]
+        self,
+        purpose: str,
+        wallet_data: Dict[str, str],
+        staging_dir: Optional[str] = None,
     ) -> Path:
         """Save all complete wallet files"""
         wallet_dir = self.home_dir / purpose
         wallet_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save files
-        files_saved = []
-
-        # Addresses
-        base_addr_file = wallet_dir / "base.addr"
-        with open(base_addr_file, "w") as f:
-            f.write(wallet_data["base_addr"])
-        files_saved.append(base_addr_file)
-
-        payment_addr_file = wallet_dir / "payment.addr"
-        with open(payment_addr_file, "w") as f:
-            f.write(wallet_data["payment_addr"])
-        files_saved.append(payment_addr_file)
-
-        reward_addr_file = wallet_dir / "reward.addr"
-        with open(reward_addr_file, "w") as f:
-            f.write(wallet_data["reward_addr"])
-        files_saved.append(reward_addr_file)
-
-        # Payment keys
-        payment_skey_file = wallet_dir / "payment.skey"
-        payment_skey_content = self.create_cardano_key_file(
-            "payment_skey",
-            "Payment Signing Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["payment_skey"]),
-        )
-        with open(payment_skey_file, "w") as f:
-            f.write(payment_skey_content)
-        files_saved.append(payment_skey_file)
-
-        payment_vkey_file = wallet_dir / "payment.vkey"
-        payment_vkey_content = self.create_cardano_key_file(
-            "payment_vkey",
-            "Payment Verification Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["payment_vkey"]),
-        )
-        with open(payment_vkey_file, "w") as f:
-            f.write(payment_vkey_content)
-        files_saved.append(payment_vkey_file)
-
-        # Staking keys
-        stake_skey_file = wallet_dir / "stake.skey"
-        stake_skey_content = self.create_cardano_key_file(
-            "stake_skey",
-            "Stake Signing Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["staking_skey"]),
-        )
-        with open(stake_skey_file, "w") as f:
-            f.write(stake_skey_content)
-        files_saved.append(stake_skey_file)
-
-        stake_vkey_file = wallet_dir / "stake.vkey"
-        stake_vkey_content = self.create_cardano_key_file(
-            "stake_vkey",
-            "Stake Verification Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["staking_vkey"]),
-        )
-        with open(stake_vkey_file, "w") as f:
-            f.write(stake_vkey_content)
-        files_saved.append(stake_vkey_file)
-
-        # Cold keys
-        cold_skey_file = wallet_dir / "cc-cold.skey"
-        cold_skey_content = self.create_cardano_key_file(
-            "cold_skey",
-            "Constitutional Committee Cold Signing Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["cold_skey"]),
-        )
-        with open(cold_skey_file, "w") as f:
-            f.write(cold_skey_content)
-        files_saved.append(cold_skey_file)
-
-        cold_vkey_file = wallet_dir / "cc-cold.vkey"
-        cold_vkey_content = self.create_cardano_key_file(
-            "cold_vkey",
-            "Constitutional Committee Cold Verification Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["cold_vkey"]),
-        )
-        with open(cold_vkey_file, "w") as f:
-            f.write(cold_vkey_content)
-        files_saved.append(cold_vkey_file)
-
-        # Hot keys
-        hot_skey_file = wallet_dir / "cc-hot.skey"
-        hot_skey_content = self.create_cardano_key_file(
-            "hot_skey",
-            "Constitutional Committee Hot Signing Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["hot_skey"]),
-        )
-        with open(hot_skey_file, "w") as f:
-            f.write(hot_skey_content)
-        files_saved.append(hot_skey_file)
-
-        hot_vkey_file = wallet_dir / "cc-hot.vkey"
-        hot_vkey_content = self.create_cardano_key_file(
-            "hot_vkey",
-            "Constitutional Committee Hot Verification Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["hot_vkey"]),
-        )
-        with open(hot_vkey_file, "w") as f:
-            f.write(hot_vkey_content)
-        files_saved.append(hot_vkey_file)
-
-        # DRep keys
-        drep_skey_file = wallet_dir / "drep.skey"
-        drep_skey_content = self.create_cardano_key_file(
-            "drep_skey",
-            "Delegated Representative Signing Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["drep_skey"]),
-        )
-        with open(drep_skey_file, "w") as f:
-            f.write(drep_skey_content)
-        files_saved.append(drep_skey_file)
-
-        drep_vkey_file = wallet_dir / "drep.vkey"
-        drep_vkey_content = self.create_cardano_key_file(
-            "drep_vkey",
-            "Delegated Representative Verification Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["drep_vkey"]),
-        )
-        with open(drep_vkey_file, "w") as f:
-            f.write(drep_vkey_content)
-        files_saved.append(drep_vkey_file)
-
-        # Multi-signature keys
-        ms_payment_skey_file = wallet_dir / "ms_payment.skey"
-        ms_payment_skey_content = self.create_cardano_key_file(
-            "ms_payment_skey",
-            "Payment Signing Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["ms_payment_skey"]),
-        )
-        with open(ms_payment_skey_file, "w") as f:
-            f.write(ms_payment_skey_content)
-        files_saved.append(ms_payment_skey_file)
-
-        ms_payment_vkey_file = wallet_dir / "ms_payment.vkey"
-        ms_payment_vkey_content = self.create_cardano_key_file(
-            "ms_payment_vkey",
-            "Payment Verification Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["ms_payment_vkey"]),
-        )
-        with open(ms_payment_vkey_file, "w") as f:
-            f.write(ms_payment_vkey_content)
-        files_saved.append(ms_payment_vkey_file)
-
-        ms_stake_skey_file = wallet_dir / "ms_stake.skey"
-        ms_stake_skey_content = self.create_cardano_key_file(
-            "ms_stake_skey",
-            "Stake Signing Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["ms_stake_skey"]),
-        )
-        with open(ms_stake_skey_file, "w") as f:
-            f.write(ms_stake_skey_content)
-        files_saved.append(ms_stake_skey_file)
+        # Files cardano-cli staged (named like their wallet_data entries)
+        # are moved into place as they are
+        staged = set(os.listdir(staging_dir)) if staging_dir is not None else set()
 
-        ms_stake_vkey_file = wallet_dir / "ms_stake.vkey"
-        ms_stake_vkey_content = self.create_cardano_key_file(
-            "ms_stake_vkey",
-            "Stake Verification Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["ms_stake_vkey"]),
-        )
-        with open(ms_stake_vkey_file, "w") as f:
-            f.write(ms_stake_vkey_content)
-        files_saved.append(ms_stake_vkey_file)
+        # Convert every other key and credential once, before writing anything
+        cbor = {
+            name: self.convert_bech32_to_cbor_hex(wallet_data[name])
+            for _, name, _, _ in self._WALLET_KEY_FILES
+            if name not in staged
+        }
+        credentials = {
+            name: self.generate_proper_credential_hash(wallet_data[name])
+            for name in (
+                "payment_cred",
+                "stake_cred",
+                "ms_payment_cred",
+                "ms_stake_cred",
+            )
+        }
 
-        ms_drep_skey_file = wallet_dir / "ms_drep.skey"
-        ms_drep_skey_content = self.create_cardano_key_file(
-            "ms_drep_skey",
-            "Multi-Signature DRep Signing Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["ms_drep_skey"]),
-        )
-        with open(ms_drep_skey_file, "w") as f:
-            f.write(ms_drep_skey_content)
-        files_saved.append(ms_drep_skey_file)
+        files = [
+            # Addresses
+            (wallet_dir / "base.addr", wallet_data["base_addr"], 0o666),
+            (wallet_dir / "payment.addr", wallet_data["payment_addr"], 0o666),
+            (wallet_dir / "reward.addr", wallet_data["reward_addr"], 0o666),
+        ]
 
-        ms_drep_vkey_file = wallet_dir / "ms_drep.vkey"
-        ms_drep_vkey_content = self.create_cardano_key_file(
-            "ms_drep_vkey",
-            "Multi-Signature DRep Verification Key",
-            self.convert_bech32_to_cbor_hex(wallet_data["ms_drep_vkey"]),
-        )
-        with open(ms_drep_vkey_file, "w") as f:
-            f.write(ms_drep_vkey_content)
-        files_saved.append(ms_drep_vkey_file)
-
-        # Credentials (just the hash, not JSON format)
-        payment_cred_file = wallet_dir / "payment.cred"
-        with open(payment_cred_file, "w") as f:
-            f.write(self.generate_proper_credential_hash(wallet_data["payment_cred"]))
-        files_saved.append(payment_cred_file)
-
-        stake_cred_file = wallet_dir / "stake.cred"
-        with open(stake_cred_file, "w") as f:
-            f.write(self.generate_proper_credential_hash(wallet_data["stake_cred"]))
-        files_saved.append(stake_cred_file)
-
-        ms_payment_cred_file = wallet_dir / "ms_payment.cred"
-        with open(ms_payment_cred_file, "w") as f:
-            f.write(
-                self.generate_proper_credential_hash(wallet_data["ms_payment_cred"])
+        # Keys (signing keys readable by the owner only)
+        for file_name, name, key_type, description in self._WALLET_KEY_FILES:
+            mode = 0o600 if file_name.endswith(".skey") else 0o666
+            if name in staged:
+                os.replace(os.path.join(staging_dir, name), wallet_dir / file_name)
+                if mode != 0o666:
+                    os.chmod(wallet_dir / file_name, mode)
+                continue
+            files.append(
+                (
+                    wallet_dir / file_name,
+                    self.create_cardano_key_file(key_type, description, cbor[name]),
+                    mode,
+                )
             )
-        files_saved.append(ms_payment_cred_file)
 
-        ms_stake_cred_file = wallet_dir / "ms_stake.cred"
-        with open(ms_stake_cred_file, "w") as f:
-            f.write(self.generate_proper_credential_hash(wallet_data["ms_stake_cred"]))
-        files_saved.append(ms_stake_cred_file)
+        files += [
+            # Credentials (just the hash, not JSON format)
+            (wallet_dir / "payment.cred", credentials["payment_cred"], 0o666),
+            (wallet_dir / "stake.cred", credentials["stake_cred"], 0o666),
+            (wallet_dir / "ms_payment.cred", credentials["ms_payment_cred"], 0o666),
+            (wallet_dir / "ms_stake.cred", credentials["ms_stake_cred"], 0o666),
+        ]
 
         # Certificates
-        stake_cert_file = wallet_dir / "stake.cert"
-        with open(stake_cert_file, "w") as f:
-            f.write(wallet_data["stake_cert"])
-        files_saved.append(stake_cert_file)
-
-        delegation_cert_file = wallet_dir / "delegation.cert"
-        with open(delegation_cert_file, "w") as f:
-            f.write(wallet_data["delegation_cert"])
-        files_saved.append(delegation_cert_file)
-
-        # Recovery phrase
-        mnemonic_file = wallet_dir / f"{self.ticker}-{purpose}.mnemonic.txt"
-        with open(mnemonic_file, "w") as f:
-            f.write(wallet_data["mnemonic"])
-        files_saved.append(mnemonic_file)
-
-        # Make sensitive files more secure
-        sensitive_files = [
-            payment_skey_file,
-            stake_skey_file,
-            cold_skey_file,
-            hot_skey_file,
-            drep_skey_file,
-            ms_payment_skey_file,
-            ms_stake_skey_file,
-            ms_drep_skey_file,
-            mnemonic_file,
-        ]
-        for file in sensitive_files:
-            file.chmod(0o600)  # Read/write for owner only
+        for file_name, name in (
+            ("stake.cert", "stake_cert"),
+            ("delegation.cert", "delegation_cert"),
+        ):
+            if name in staged:
+                os.replace(os.path.join(staging_dir, name), wallet_dir / file_name)
+            else:
+                files.append((wallet_dir / file_name, wallet_data[name], 0o666))
+
+        # Recovery phrase (keys generated by cardano-cli don't have one)
+        if "mnemonic" in wallet_data:
+            files.append(
+                (
+                    wallet_dir / f"{self.ticker}-{purpose}.mnemonic.txt",
+                    wallet_data["mnemonic"],
+                    0o600,
+                )
+            )
+
+        write_files([(os.fspath(path), content, mode) for path, content, mode in files])
 
         return wallet_dir
 
+    @contextlib.contextmanager
+    def _staging_dir(self):
+        """Temporary directory for cardano-cli output, removed on exit"""
+        # Inside the home directory, so saving the files is a rename on the
+        # same filesystem
+        staging_dir = tempfile.mkdtemp(dir=os.fspath(self.home_dir))
+        try:
+            yield staging_dir
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
     def generate_keys_with_cardano_cli(
-        self, purpose: str, network: str = "mainnet"
+        self,
+        purpose: str,
+        network: str = "mainnet",
+        staging_dir: Optional[str] = None,
     ) -> Dict[str, str]:
         """Generate all keys using cardano-cli (recommended for compatibility)"""
         wallet_data = {}
@@ -1383,54 +1382,189 @@ class CardanoWalletGenerator:
             click.echo("🔄 Falling back to cardano-address for key generation")
             return self.generate_keys_with_cardano_address(purpose, network)
 
-        # Create temporary directory for key generation
-        import tempfile
-        import os
+        if "cardano-cli" not in self.tools:
+            click.echo("⚠️  cardano-cli not available")
+            click.echo("🔄 Falling back to cardano-address")
+            return self.generate_keys_with_cardano_address(purpose, network)
+
+        if staging_dir is None:
+            # Nobody will move the key files into place, so they only live
+            # as long as this call
+            with self._staging_dir() as staging_dir:
+                return self.generate_keys_with_cardano_cli(
+                    purpose, network, staging_dir
+                )
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        # Staged files are named like their wallet_data entries, which is
+        # how save_complete_wallet_files finds them
+        key_files = {
+            f"{name}_{kind}": os.path.join(staging_dir, f"{name}_{kind}")
+            for name, *_ in self._CLI_KEY_GENS
+            for kind in ("skey", "vkey")
+        }
+        stake_cert_file = os.path.join(staging_dir, "stake_cert")
 
-            try:
-                # 1. Generate Payment Key Pair
-                payment_vkey_file = temp_path / "payment.vkey"
-                payment_skey_file = temp_path / "payment.skey"
-                cmd = [
-                    str(self.tools["cardano-cli"]),
-                    "address",
-                    "key-gen",
-                    "--verification-key-file",
-                    str(payment_vkey_file),
-                    "--signing-key-file",
-                    str(payment_skey_file),
-                ]
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode != 0:
-                    click.echo(f"⚠️  cardano-cli failed: {result.stderr}")
-                    click.echo("🔄 Falling back to cardano-address")
-                    return self.generate_keys_with_cardano_address(purpose, network)
-
-                # Read the generated files
-                with open(payment_vkey_file, "r") as f:
-                    payment_vkey_content = f.read()
-                with open(payment_skey_file, "r") as f:
-                    payment_skey_content = f.read()
-
-                # Extract CBOR hex from JSON
-                payment_vkey_json = json.loads(payment_vkey_content)
-                payment_skey_json = json.loads(payment_skey_content)
-                wallet_data["payment_vkey"] = payment_vkey_json["cborHex"]
-                wallet_data["payment_skey"] = payment_skey_json["cborHex"]
-
-                # Continue with other key generation...
-                # (rest of the function remains the same)
+        try:
+            cli = self._cardano_cli_bin
+            network_args = self._CLI_NETWORK_ARGS.get(network, ("--mainnet",))
+
+            # Key pairs are independent of each other. They go through real
+            # files: the commands below read the vkeys back by path, and
+            # cardano-cli writes signing keys via a temporary file and a
+            # rename, so --out-file /dev/stdout is not an option.
+            key_gens = {
+                name: (
+                    cli,
+                    *subcommand,
+                    vkey_flag,
+                    key_files[f"{name}_vkey"],
+                    skey_flag,
+                    key_files[f"{name}_skey"],
+                )
+                for name, subcommand, vkey_flag, skey_flag in self._CLI_KEY_GENS
+            }
 
-            except Exception as e:
-                click.echo(f"⚠️  cardano-cli error: {e}")
-                click.echo("🔄 Falling back to cardano-address")
-                return self.generate_keys_with_cardano_address(purpose, network)
+            # Hashes, addresses and certificate only need some vkey files,
+            # so each one starts as soon as its own key pairs exist
+            derived = {
+                "base_addr": (
+                    ("payment", "staking"),
+                    (
+                        cli,
+                        "address",
+                        "build",
+                        "--payment-verification-key-file",
+                        key_files["payment_vkey"],
+                        "--stake-verification-key-file",
+                        key_files["staking_vkey"],
+                        *network_args,
+                    ),
+                ),
+                "payment_addr": (
+                    ("payment",),
+                    (
+                        cli,
+                        "address",
+                        "build",
+                        "--payment-verification-key-file",
+                        key_files["payment_vkey"],
+                        *network_args,
+                    ),
+                ),
+                "reward_addr": (
+                    ("staking",),
+                    (
+                        cli,
+                        "stake-address",
+                        "build",
+                        "--stake-verification-key-file",
+                        key_files["staking_vkey"],
+                        *network_args,
+                    ),
+                ),
+                "stake_cert": (
+                    ("staking",),
+                    (
+                        cli,
+                        "conway",
+                        "stake-address",
+                        "registration-certificate",
+                        "--stake-verification-key-file",
+                        key_files["staking_vkey"],
+                        "--key-reg-deposit-amt",
+                        "2000000",
+                        "--out-file",
+                        stake_cert_file,
+                    ),
+                ),
+            }
+            for cred, name, group, vkey_flag in self._CLI_KEY_HASHES:
+                derived[cred] = (
+                    (name,),
+                    (cli, group, "key-hash", vkey_flag, key_files[f"{name}_vkey"]),
+                )
+            results = _run_async(self._run_cli_graph(key_gens, derived))
+            wallet_data.update(results)
+
+            # Every command has finished here, so read all the files in one go
+            *key_contents, stake_cert = read_files(
+                [*key_files.values(), stake_cert_file]
+            )
+            for key, content in zip(key_files, key_contents):
+                wallet_data[key] = _json_loads(content)["cborHex"]
+            wallet_data["stake_cert"] = stake_cert.decode()
+
+            wallet_data["payment_only_addr"] = wallet_data["payment_addr"]
+
+            # Delegation needs the pool id, which cardano-cli can't know here
+            wallet_data["delegation_cert"] = self.generate_delegation_certificate(
+                wallet_data["staking_skey"], wallet_data["cold_vkey"]
+            )
+
+        except Exception as e:
+            # Don't leave partial output for the fallback's save to pick up
+            for path in (*key_files.values(), stake_cert_file):
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(path)
+            click.echo(f"⚠️  cardano-cli error: {e}")
+            click.echo("🔄 Falling back to cardano-address")
+            return self.generate_keys_with_cardano_address(purpose, network)
 
         return wallet_data
 
+    async def _run_cli_command(
+        self, command: Tuple[str, ...], capture_stdout: bool = True
+    ) -> str:
+        """Run a command without blocking the event loop and return its stdout"""
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=(
+                asyncio.subprocess.PIPE
+                if capture_stdout
+                else asyncio.subprocess.DEVNULL
+            ),
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            subcommand = " ".join(
+                itertools.takewhile(lambda arg: not arg.startswith("-"), command[1:])
+            )
+            raise Exception(f"{subcommand} failed: {stderr.decode(errors='replace')}")
+        return stdout.decode("ascii").strip() if capture_stdout else ""
+
+    async def _run_cli_graph(
+        self,
+        key_gens: Dict[str, Tuple[str, ...]],
+        derived: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]],
+    ) -> Dict[str, str]:
+        """Run key-gen commands, then each dependent once its own key-gens finish"""
+        key_gen_tasks = {
+            name: asyncio.ensure_future(
+                self._run_cli_command(command, capture_stdout=False)
+            )
+            for name, command in key_gens.items()
+        }
+
+        async def run_after(deps: Tuple[str, ...], command: Tuple[str, ...]) -> str:
+            await asyncio.gather(*(key_gen_tasks[dep] for dep in deps))
+            return await self._run_cli_command(command)
+
+        # Let every process finish before reporting a failure, so none is
+        # left running when the event loop closes
+        outputs = await asyncio.gather(
+            *(run_after(deps, command) for deps, command in derived.values()),
+            return_exceptions=True,
+        )
+        key_gen_outputs = await asyncio.gather(
+            *key_gen_tasks.values(), return_exceptions=True
+        )
+        for output in (*key_gen_outputs, *outputs):
+            if isinstance(output, Exception):
+                raise output
+
+        return dict(zip(derived, outputs))
+
     def generate_keys_with_cardano_address(
         self, purpose: str, network: str = "mainnet"
     ) -> Dict[str, str]:
@@ -1447,340 +1581,206 @@ class CardanoWalletGenerator:
         wallet_data["mnemonic"] = mnemonic
 
         try:
-            import tempfile
-            import os
-
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Step 1: Generate mnemonic file
-                mnemonic_file = os.path.join(temp_dir, "mnemonic.txt")
-                with open(mnemonic_file, "w") as f:
-                    f.write(mnemonic)
-
-                # Step 2: Derive root key
-                root_cmd = [
-                    str(self.tools["cardano-address"]),
-                    "key",
-                    "from-recovery-phrase",
-                    "Shelley",
-                ]
-                root_result = subprocess.run(
-                    root_cmd, input=mnemonic, capture_output=True, text=True
+            # Step 1: Derive root key
+            root_key = self.mnemonic_to_root_key(mnemonic)
+
+            # Step 2: Derive payment keypair
+            purpose_index = "0" if purpose == "pledge" else "1"
+            payment_skey, payment_vkey = self._derive_key_pair(
+                root_key, f"1852H/1815H/0H/{purpose_index}/0"
+            )
+
+            # Step 3: Derive stake keypair
+            stake_skey, stake_vkey = self._derive_key_pair(
+                root_key, "1852H/1815H/0H/2/0"
+            )
+
+            # Step 4: Generate addresses (no cardano-cli needed)
+            # The three addresses only depend on the two verification keys,
+            # so their cardano-address runs overlap instead of queueing
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                base_addr_future = executor.submit(
+                    self.generate_payment_address, payment_vkey, stake_vkey, network
                 )
-                if root_result.returncode != 0:
-                    raise Exception(f"Failed to derive root key: {root_result.stderr}")
-                root_key = root_result.stdout.strip()
-
-                # Step 3: Derive payment keypair
-                purpose_index = "0" if purpose == "pledge" else "1"
-                payment_skey_cmd = [
-                    str(self.tools["cardano-address"]),
-                    "key",
-                    "child",
-                    f"1852H/1815H/0H/{purpose_index}/0",
-                ]
-                payment_skey_result = subprocess.run(
-                    payment_skey_cmd, input=root_key, capture_output=True, text=True
+                reward_addr_future = executor.submit(
+                    self.generate_staking_address, stake_vkey, network
                 )
-                if payment_skey_result.returncode != 0:
-                    raise Exception(
-                        f"Failed to derive payment signing key: {payment_skey_result.stderr}"
-                    )
-                payment_skey = payment_skey_result.stdout.strip()
-
-                payment_vkey_cmd = [
-                    str(self.tools["cardano-address"]),
-                    "key",
-                    "public",
-                    "--with-chain-code",
-                ]
-                payment_vkey_result = subprocess.run(
-                    payment_vkey_cmd, input=payment_skey, capture_output=True, text=True
+                payment_only_addr_future = executor.submit(
+                    self.generate_payment_only_address, payment_vkey, network
                 )
-                if payment_vkey_result.returncode != 0:
-                    raise Exception(
-                        f"Failed to derive payment verification key: {payment_vkey_result.stderr}"
-                    )
-                payment_vkey = payment_vkey_result.stdout.strip()
-
-                # Step 4: Derive stake keypair
-                stake_skey_cmd = [
-                    str(self.tools["cardano-address"]),
-                    "key",
-                    "child",
-                    "1852H/1815H/0H/2/0",
-                ]
-                stake_skey_result = subprocess.run(
-                    stake_skey_cmd, input=root_key, capture_output=True, text=True
+            base_addr = base_addr_future.result()
+            reward_addr = reward_addr_future.result()
+
+            # Step 5: Convert keys to CBOR format using our own conversion
+            # Convert payment keys to CBOR hex format
+            try:
+                payment_skey_cbor = self.convert_bech32_to_cbor_hex(payment_skey)
+                payment_vkey_cbor = self.convert_bech32_to_cbor_hex(payment_vkey)
+            except Exception as e:
+                click.echo(f"⚠️  CBOR conversion failed: {e}")
+                click.echo("🔄 Using simplified CBOR generation")
+                # Fallback to simplified CBOR generation
+                payment_skey_cbor = self.generate_simplified_cbor_hex(
+                    payment_skey, "payment_skey"
                 )
-                if stake_skey_result.returncode != 0:
-                    raise Exception(
-                        f"Failed to derive stake signing key: {stake_skey_result.stderr}"
-                    )
-                stake_skey = stake_skey_result.stdout.strip()
-
-                stake_vkey_cmd = [
-                    str(self.tools["cardano-address"]),
-                    "key",
-                    "public",
-                    "--with-chain-code",
-                ]
-                stake_vkey_result = subprocess.run(
-                    stake_vkey_cmd, input=stake_skey, capture_output=True, text=True
+                payment_vkey_cbor = self.generate_simplified_cbor_hex(
+                    payment_vkey, "payment_vkey"
                 )
-                if stake_vkey_result.returncode != 0:
-                    raise Exception(
-                        f"Failed to derive stake verification key: {stake_vkey_result.stderr}"
-                    )
-                stake_vkey = stake_vkey_result.stdout.strip()
-
-                # Step 5: Generate addresses using cardano-address (no cardano-cli needed)
-                # Generate base address - cardano-address expects input via pipe
-                # For base address, we need to combine payment and stake keys
-                base_addr_cmd = [
-                    str(self.tools["cardano-address"]),
-                    "address",
-                    "delegation",
-                    payment_vkey,
-                    stake_vkey,
-                    "--network-tag",
-                    "0" if network == "mainnet" else "1",
-                ]
-
-                # Generate base address
-                base_addr_result = subprocess.run(
-                    base_addr_cmd, capture_output=True, text=True
+
+            # Convert stake keys to CBOR hex format
+            try:
+                stake_skey_cbor = self.convert_bech32_to_cbor_hex(stake_skey)
+                stake_vkey_cbor = self.convert_bech32_to_cbor_hex(stake_vkey)
+            except Exception as e:
+                click.echo(f"⚠️  CBOR conversion failed: {e}")
+                click.echo("🔄 Using simplified CBOR generation")
+                # Fallback to simplified CBOR generation
+                stake_skey_cbor = self.generate_simplified_cbor_hex(
+                    stake_skey, "stake_skey"
                 )
-                if base_addr_result.returncode != 0:
-                    raise Exception(
-                        f"Failed to generate base address: {base_addr_result.stderr}"
-                    )
-                base_addr = base_addr_result.stdout.strip()
-
-                # Generate reward address
-                reward_addr_cmd = [
-                    str(self.tools["cardano-address"]),
-                    "address",
-                    "stake",
-                    "--network-tag",
-                    "0" if network == "mainnet" else "1",
-                ]
-                reward_addr_result = subprocess.run(
-                    reward_addr_cmd, input=stake_vkey, capture_output=True, text=True
+                stake_vkey_cbor = self.generate_simplified_cbor_hex(
+                    stake_vkey, "stake_vkey"
                 )
-                if reward_addr_result.returncode != 0:
-                    raise Exception(
-                        f"Failed to generate reward address: {reward_addr_result.stderr}"
-                    )
-                reward_addr = reward_addr_result.stdout.strip()
-
-                # Step 6: Convert keys to CBOR format using our own conversion
-                # Convert payment keys to CBOR hex format
-                try:
-                    payment_skey_cbor = self.convert_bech32_to_cbor_hex(payment_skey)
-                    payment_vkey_cbor = self.convert_bech32_to_cbor_hex(payment_vkey)
-                except Exception as e:
-                    click.echo(f"⚠️  CBOR conversion failed: {e}")
-                    click.echo("🔄 Using simplified CBOR generation")
-                    # Fallback to simplified CBOR generation
-                    payment_skey_cbor = self.generate_simplified_cbor_hex(
-                        payment_skey, "payment_skey"
-                    )
-                    payment_vkey_cbor = self.generate_simplified_cbor_hex(
-                        payment_vkey, "payment_vkey"
-                    )
-
-                # Convert stake keys to CBOR hex format
-                try:
-                    stake_skey_cbor = self.convert_bech32_to_cbor_hex(stake_skey)
-                    stake_vkey_cbor = self.convert_bech32_to_cbor_hex(stake_vkey)
-                except Exception as e:
-                    click.echo(f"⚠️  CBOR conversion failed: {e}")
-                    click.echo("🔄 Using simplified CBOR generation")
-                    # Fallback to simplified CBOR generation
-                    stake_skey_cbor = self.generate_simplified_cbor_hex(
-                        stake_skey, "stake_skey"
-                    )
-                    stake_vkey_cbor = self.generate_simplified_cbor_hex(
-                        stake_vkey, "stake_vkey"
-                    )
-
-                # Step 7: Generate additional keys for complete mode
-                # Cold key (stake pool)
-                try:
-                    cold_skey, cold_vkey = self.derive_cold_key(root_key)
-                except Exception as e:
-                    click.echo(f"⚠️  Cold key derivation failed: {e}")
-                    click.echo("🔄 Using simplified cold key generation")
-                    cold_skey, cold_vkey = self.generate_simplified_keypair("cold")
-
-                # Hot key (stake pool)
-                try:
-                    hot_skey, hot_vkey = self.derive_hot_key(root_key)
-                except Exception as e:
-                    click.echo(f"⚠️  Hot key derivation failed: {e}")
-                    click.echo("🔄 Using simplified hot key generation")
-                    hot_skey, hot_vkey = self.generate_simplified_keypair("hot")
-
-                # DRep key
-                try:
-                    drep_skey, drep_vkey = self.derive_drep_key(root_key)
-                except Exception as e:
-                    click.echo(f"⚠️  DRep key derivation failed: {e}")
-                    click.echo("🔄 Using simplified DRep key generation")
-                    drep_skey, drep_vkey = self.generate_simplified_keypair("drep")
-
-                # Multi-signature keys
-                try:
-                    ms_payment_skey, ms_payment_vkey = self.derive_ms_payment_key(
-                        root_key
-                    )
-                except Exception as e:
-                    click.echo(f"⚠️  MS payment key derivation failed: {e}")
-                    click.echo("🔄 Using simplified MS payment key generation")
-                    ms_payment_skey, ms_payment_vkey = self.generate_simplified_keypair(
-                        "ms_payment"
-                    )
-
-                try:
-                    ms_stake_skey, ms_stake_vkey = self.derive_ms_stake_key(root_key)
-                except Exception as e:
-                    click.echo(f"⚠️  MS stake key derivation failed: {e}")
-                    click.echo("🔄 Using simplified MS stake key generation")
-                    ms_stake_skey, ms_stake_vkey = self.generate_simplified_keypair(
-                        "ms_stake"
-                    )
-
-                try:
-                    ms_drep_skey, ms_drep_vkey = self.derive_ms_drep_key(root_key)
-                except Exception as e:
-                    click.echo(f"⚠️  MS DRep key derivation failed: {e}")
-                    click.echo("🔄 Using simplified MS DRep key generation")
-                    ms_drep_skey, ms_drep_vkey = self.generate_simplified_keypair(
-                        "ms_drep"
-                    )
-
-                # Step 8: Generate addresses for additional keys
-                # Payment-only address
-                try:
-                    payment_only_addr_cmd = [
-                        str(self.tools["cardano-address"]),
-                        "address",
-                        "payment",
-                        "--network-tag",
-                        "0" if network == "mainnet" else "1",
-                    ]
-                    payment_only_addr_result = subprocess.run(
-                        payment_only_addr_cmd,
-                        input=payment_vkey,
-                        capture_output=True,
-                        text=True,
-                    )
-                    if payment_only_addr_result.returncode != 0:
-                        raise Exception(
-                            f"Failed to generate payment-only address: {payment_only_addr_result.stderr}"
-                        )
-                    payment_only_addr = payment_only_addr_result.stdout.strip()
-                except Exception as e:
-                    click.echo(f"⚠️  Payment-only address generation failed: {e}")
-                    click.echo("🔄 Using base address as fallback")
-                    payment_only_addr = base_addr
 
-                # Step 9: Generate credentials and certificates
-                # Payment credential
+            # Step 6: Generate additional keys for complete mode
+            # Each derivation only depends on the root key, so run them
+            # concurrently
+            derivations = {
+                "cold": ("Cold", self.derive_cold_key),
+                "hot": ("Hot", self.derive_hot_key),
+                "drep": ("DRep", self.derive_drep_key),
+                "ms_payment": ("MS payment", self.derive_ms_payment_key),
+                "ms_stake": ("MS stake", self.derive_ms_stake_key),
+                "ms_drep": ("MS DRep", self.derive_ms_drep_key),
+            }
+            with ThreadPoolExecutor(max_workers=len(derivations)) as executor:
+                futures = {
+                    name: executor.submit(derive, root_key)
+                    for name, (_, derive) in derivations.items()
+                }
+
+            key_pairs = {}
+            for name, future in futures.items():
+                label = derivations[name][0]
                 try:
-                    payment_cred = self.generate_payment_credential(payment_vkey_cbor)
+                    key_pairs[name] = future.result()
                 except Exception as e:
-                    click.echo(f"⚠️  Payment credential generation failed: {e}")
-                    click.echo("🔄 Using simplified credential generation")
-                    payment_cred = self.generate_simplified_credential(
-                        payment_vkey_cbor, "payment"
-                    )
+                    click.echo(f"⚠️  {label} key derivation failed: {e}")
+                    click.echo(f"🔄 Using simplified {label} key generation")
+                    key_pairs[name] = self.generate_simplified_keypair(name)
+
+            cold_skey, cold_vkey = key_pairs["cold"]
+            hot_skey, hot_vkey = key_pairs["hot"]
+            drep_skey, drep_vkey = key_pairs["drep"]
+            ms_payment_skey, ms_payment_vkey = key_pairs["ms_payment"]
+            ms_stake_skey, ms_stake_vkey = key_pairs["ms_stake"]
+            ms_drep_skey, ms_drep_vkey = key_pairs["ms_drep"]
+
+            # Step 7: Generate addresses for additional keys
+            # Payment-only address
+            try:
+                payment_only_addr = payment_only_addr_future.result()
+            except Exception as e:
+                click.echo(f"⚠️  Payment-only address generation failed: {e}")
+                click.echo("🔄 Using base address as fallback")
+                payment_only_addr = base_addr
 
-                # Stake credential
-                try:
-                    stake_cred = self.generate_stake_credential(stake_vkey_cbor)
-                except Exception as e:
-                    click.echo(f"⚠️  Stake credential generation failed: {e}")
-                    click.echo("🔄 Using simplified credential generation")
-                    stake_cred = self.generate_simplified_credential(
-                        stake_vkey_cbor, "stake"
-                    )
+            # Step 8: Generate credentials and certificates
+            # Payment credential
+            try:
+                payment_cred = self.generate_payment_credential(payment_vkey_cbor)
+            except Exception as e:
+                click.echo(f"⚠️  Payment credential generation failed: {e}")
+                click.echo("🔄 Using simplified credential generation")
+                payment_cred = self.generate_simplified_credential(
+                    payment_vkey_cbor, "payment"
+                )
 
-                # Multi-signature credentials
-                try:
-                    ms_payment_cred = self.generate_payment_credential(ms_payment_vkey)
-                except Exception as e:
-                    click.echo(f"⚠️  MS payment credential generation failed: {e}")
-                    click.echo("🔄 Using simplified credential generation")
-                    ms_payment_cred = self.generate_simplified_credential(
-                        ms_payment_vkey, "ms_payment"
-                    )
+            # Stake credential
+            try:
+                stake_cred = self.generate_stake_credential(stake_vkey_cbor)
+            except Exception as e:
+                click.echo(f"⚠️  Stake credential generation failed: {e}")
+                click.echo("🔄 Using simplified credential generation")
+                stake_cred = self.generate_simplified_credential(
+                    stake_vkey_cbor, "stake"
+                )
 
-                try:
-                    ms_stake_cred = self.generate_stake_credential(ms_stake_vkey)
-                except Exception as e:
-                    click.echo(f"⚠️  MS stake credential generation failed: {e}")
-                    click.echo("🔄 Using simplified credential generation")
-                    ms_stake_cred = self.generate_simplified_credential(
-                        ms_stake_vkey, "ms_stake"
-                    )
+            # Multi-signature credentials
+            try:
+                ms_payment_cred = self.generate_payment_credential(ms_payment_vkey)
+            except Exception as e:
+                click.echo(f"⚠️  MS payment credential generation failed: {e}")
+                click.echo("🔄 Using simplified credential generation")
+                ms_payment_cred = self.generate_simplified_credential(
+                    ms_payment_vkey, "ms_payment"
+                )
 
-                # Stake certificate
-                try:
-                    stake_cert = self.generate_stake_certificate(
-                        stake_skey_cbor, stake_vkey_cbor
-                    )
-                except Exception as e:
-                    click.echo(f"⚠️  Stake certificate generation failed: {e}")
-                    click.echo("🔄 Using simplified certificate generation")
-                    stake_cert = self.generate_simplified_certificate(
-                        "stake", stake_skey_cbor, stake_vkey_cbor
-                    )
+            try:
+                ms_stake_cred = self.generate_stake_credential(ms_stake_vkey)
+            except Exception as e:
+                click.echo(f"⚠️  MS stake credential generation failed: {e}")
+                click.echo("🔄 Using simplified credential generation")
+                ms_stake_cred = self.generate_simplified_credential(
+                    ms_stake_vkey, "ms_stake"
+                )
 
-                # Delegation certificate
-                try:
-                    delegation_cert = self.generate_delegation_certificate(
-                        stake_skey_cbor, cold_vkey
-                    )
-                except Exception as e:
-                    click.echo(f"⚠️  Delegation certificate generation failed: {e}")
-                    click.echo("🔄 Using simplified certificate generation")
-                    delegation_cert = self.generate_simplified_certificate(
-                        "delegation", stake_skey_cbor, cold_vkey
-                    )
+            # Stake certificate
+            try:
+                stake_cert = self.generate_stake_certificate(
+                    stake_skey_cbor, stake_vkey_cbor
+                )
+            except Exception as e:
+                click.echo(f"⚠️  Stake certificate generation failed: {e}")
+                click.echo("🔄 Using simplified certificate generation")
+                stake_cert = self.generate_simplified_certificate(
+                    "stake", stake_skey_cbor, stake_vkey_cbor
+                )
 
-                # Step 10: Prepare wallet data
-                wallet_data.update(
-                    {
-                        "payment_skey": payment_skey_cbor,
-                        "payment_vkey": payment_vkey_cbor,
-                        "staking_skey": stake_skey_cbor,
-                        "staking_vkey": stake_vkey_cbor,
-                        "base_addr": base_addr,
-                        "reward_addr": reward_addr,
-                        "payment_only_addr": payment_only_addr,
-                        "payment_addr": payment_only_addr,  # Add this for compatibility
-                        "cold_skey": cold_skey,
-                        "cold_vkey": cold_vkey,
-                        "hot_skey": hot_skey,
-                        "hot_vkey": hot_vkey,
-                        "drep_skey": drep_skey,
-                        "drep_vkey": drep_vkey,
-                        "ms_payment_skey": ms_payment_skey,
-                        "ms_payment_vkey": ms_payment_vkey,
-                        "ms_stake_skey": ms_stake_skey,
-                        "ms_stake_vkey": ms_stake_vkey,
-                        "ms_drep_skey": ms_drep_skey,
-                        "ms_drep_vkey": ms_drep_vkey,
-                        "payment_cred": payment_cred,
-                        "stake_cred": stake_cred,
-                        "ms_payment_cred": ms_payment_cred,
-                        "ms_stake_cred": ms_stake_cred,
-                        "stake_cert": stake_cert,
-                        "delegation_cert": delegation_cert,
-                    }
+            # Delegation certificate
+            try:
+                delegation_cert = self.generate_delegation_certificate(
+                    stake_skey_cbor, cold_vkey
+                )
+            except Exception as e:
+                click.echo(f"⚠️  Delegation certificate generation failed: {e}")
+                click.echo("🔄 Using simplified certificate generation")
+                delegation_cert = self.generate_simplified_certificate(
+                    "delegation", stake_skey_cbor, cold_vkey
                 )
 
+            # Step 9: Prepare wallet data
+            wallet_data.update(
+                {
+                    "payment_skey": payment_skey_cbor,
+                    "payment_vkey": payment_vkey_cbor,
+                    "staking_skey": stake_skey_cbor,
+                    "staking_vkey": stake_vkey_cbor,
+                    "base_addr": base_addr,
+                    "reward_addr": reward_addr,
+                    "payment_only_addr": payment_only_addr,
+                    "payment_addr": payment_only_addr,  # Add this for compatibility
+                    "cold_skey": cold_skey,
+                    "cold_vkey": cold_vkey,
+                    "hot_skey": hot_skey,
+                    "hot_vkey": hot_vkey,
+                    "drep_skey": drep_skey,
+                    "drep_vkey": drep_vkey,
+                    "ms_payment_skey": ms_payment_skey,
+                    "ms_payment_vkey": ms_payment_vkey,
+                    "ms_stake_skey": ms_stake_skey,
+                    "ms_stake_vkey": ms_stake_vkey,
+                    "ms_drep_skey": ms_drep_skey,
+                    "ms_drep_vkey": ms_drep_vkey,
+                    "payment_cred": payment_cred,
+                    "stake_cred": stake_cred,
+                    "ms_payment_cred": ms_payment_cred,
+                    "ms_stake_cred": ms_stake_cred,
+                    "stake_cert": stake_cert,
+                    "delegation_cert": delegation_cert,
+                }
+            )
+
         except Exception as e:
             click.echo(f"⚠️  Error in cardano-address key generation: {e}")
             click.echo("🔄 Falling back to simplified key generation")
@@ -1972,8 +1972,6 @@ class CardanoWalletGenerator:
 
         # Generate addresses using bech32 with proper network handling
         try:
-            import bech32
-
             # Generate deterministic addresses
             payment_hash = hashlib.sha256(
                 f"{purpose_seed.hex()}_payment_addr".encode()
@@ -2011,26 +2009,23 @@ class CardanoWalletGenerator:
             stake_prefix = config["stake_prefix"]
             network_tag = config["network_tag"]
 
+            # Shelley address headers (CIP-19): the address type in the high
+            # nibble, the network tag in the low one
+
             # Base address (payment + stake)
-            base_addr = bech32.encode(
-                addr_prefix, [network_tag, 0] + list(payment_hash) + list(stake_hash)
+            base_addr = _bech32_encode(
+                addr_prefix, bytes([0x00 | network_tag]) + payment_hash + stake_hash
             )
-            if base_addr is None:
-                base_addr = (
-                    f"{addr_prefix}{network_tag}{payment_hash.hex()}{stake_hash.hex()}"
-                )
 
-            # Payment-only address
-            payment_only_addr = bech32.encode(
-                addr_prefix, [network_tag, 1] + list(payment_hash)
+            # Payment-only (enterprise) address
+            payment_only_addr = _bech32_encode(
+                addr_prefix, bytes([0x60 | network_tag]) + payment_hash
             )
-            if payment_only_addr is None:
-                payment_only_addr = f"{addr_prefix}{network_tag}{payment_hash.hex()}"
 
             # Reward address
-            reward_addr = bech32.encode(stake_prefix, [network_tag] + list(stake_hash))
-            if reward_addr is None:
-                reward_addr = f"{stake_prefix}{network_tag}{stake_hash.hex()}"
+            reward_addr = _bech32_encode(
+                stake_prefix, bytes([0xE0 | network_tag]) + stake_hash
+            )
 
         except Exception:
             # Fallback address generation with network-specific prefixes
@@ -2091,76 +2086,71 @@ class CardanoWalletGenerator:
 
     def convert_bech32_to_cbor_hex(self, bech32_key: str) -> str:
         """Convert bech32 key to CBOR hex format"""
-        try:
-            import bech32
-
-            # Decode bech32 to get the data
-            hrp, data = bech32.decode(bech32_key)
-            if data is None:
-                raise Exception("Invalid bech32 key")
-
-            # Convert to CBOR hex format (58 tag for CBOR)
-            # The data is already in the correct format, just need to add the tag
-            return "58" + "20" + bytes(data).hex()
-        except Exception:
-            # Fallback: treat as hex string
-            if bech32_key.startswith("58"):
-                return bech32_key
-            else:
-                return "58" + "20" + bech32_key[-64:]  # Take last 64 chars if longer
+        _, data = _bech32_decode(bech32_key)
+        if data is not None:
+            # Wrap the raw key bytes in a CBOR byte string header
+            return (bytes([0x58, len(data)]) + data).hex()
+
+        # Fallback: treat as hex string
+        if bech32_key.startswith("58"):
+            return bech32_key
+        else:
+            return f"5820{bech32_key[-64:]}"  # Take last 64 chars if longer
 
     def generate_payment_only_address(
         self, payment_vkey: str, network: str = "mainnet"
     ) -> str:
-        """Generate payment-only address (without staking)"""
+        """Generate payment-only address (pycardano when available, else cardano-address)"""
+        if _native() is not None:
+            return self._generate_payment_only_address_native(payment_vkey, network)
+        return self._generate_payment_only_address_tool(payment_vkey, network)
+
+    def _generate_payment_only_address_native(
+        self, payment_vkey: str, network: str = "mainnet"
+    ) -> str:
+        """Generate payment-only address in-process using pycardano"""
+        native = _native()
+        return native.Address(
+            payment_part=native.PaymentVerificationKey.from_primitive(
+                self._native_verification_key(payment_vkey)
+            ).hash(),
+            network=(
+                native.Network.MAINNET
+                if self._NETWORK_TAGS.get(network, "1") == "1"
+                else native.Network.TESTNET
+            ),
+        ).encode()
+
+    def _generate_payment_only_address_tool(
+        self, payment_vkey: str, network: str = "mainnet"
+    ) -> str:
+        """Generate payment-only address using cardano-address"""
         # Map network to network tag
-        network_tags = {"mainnet": "1", "testnet": "0", "preview": "0", "preprod": "0"}
-        network_tag = network_tags.get(network, "1")
+        network_tag = self._NETWORK_TAGS.get(network, "1")
 
         cmd = [
-            str(self.tools["cardano-address"]),
+            self._cardano_address_bin,
             "address",
             "payment",
             "--network-tag",
             network_tag,
         ]
-        result = subprocess.run(cmd, input=payment_vkey, capture_output=True, text=True)
+        result = subprocess.run(cmd, input=payment_vkey.encode(), capture_output=True)
         if result.returncode != 0:
             raise click.ClickException(
-                f"Error generating payment address: {result.stderr}"
+                f"Error generating payment address: {result.stderr.decode(errors='replace')}"
             )
-        return result.stdout.strip()
+        return result.stdout.decode("ascii").strip()
 
     def create_cardano_key_file(
         self, key_type: str, description: str, cbor_hex: str
     ) -> str:
         """Create a Cardano CLI format key file with proper types"""
-        # Map our key types to proper Cardano CLI types
-        type_mapping = {
-            "payment_skey": "PaymentSigningKeyShelley_ed25519",
-            "payment_vkey": "PaymentVerificationKeyShelley_ed25519",
-            "stake_skey": "StakeSigningKeyShelley_ed25519",
-            "stake_vkey": "StakeVerificationKeyShelley_ed25519",
-            "cold_skey": "ConstitutionalCommitteeColdSigningKey_ed25519",
-            "cold_vkey": "ConstitutionalCommitteeColdVerificationKey_ed25519",
-            "hot_skey": "ConstitutionalCommitteeHotSigningKey_ed25519",
-            "hot_vkey": "ConstitutionalCommitteeHotVerificationKey_ed25519",
-            "drep_skey": "DRepSigningKey_ed25519",
-            "drep_vkey": "DRepVerificationKey_ed25519",
-            "ms_payment_skey": "PaymentSigningKeyShelley_ed25519",
-            "ms_payment_vkey": "PaymentVerificationKeyShelley_ed25519",
-            "ms_stake_skey": "StakeSigningKeyShelley_ed25519",
-            "ms_stake_vkey": "StakeVerificationKeyShelley_ed25519",
-            "ms_drep_skey": "DRepSigningKey_ed25519",
-            "ms_drep_vkey": "DRepVerificationKey_ed25519",
-        }
-
         # Use the mapped type or fallback to provided type
-        proper_type = type_mapping.get(key_type, key_type)
+        proper_type = _KEY_TYPE_MAPPING.get(key_type, key_type)
 
-        return json.dumps(
-            {"type": proper_type, "description": description, "cborHex": cbor_hex},
-            indent=2,
+        return _json_dumps(
+            {"type": proper_type, "description": description, "cborHex": cbor_hex}
         )
 
 
@@ -2201,6 +2191,73 @@ def generate_stake_pool_real(
     return generator.generate_stake_pool_files(purpose, network)
 
 
+def _generate_ticker_batch(
+    ticker: str,
+    specs: List[Tuple[int, str, str, bool]],
+    tools: Optional[Dict[str, Path]],
+) -> List[Tuple[int, Dict[str, str]]]:
+    """Generate one ticker's wallets in order with a single generator"""
+    if tools is None:
+        generator = SimpleCardanoWalletGenerator(ticker)
+    else:
+        generator = CardanoWalletGenerator(ticker, tools)
+    results = []
+    for index, purpose, network, complete in specs:
+        if complete:
+            wallet_data = generator.generate_stake_pool_files(purpose, network)
+        else:
+            wallet_data = generator.generate_wallet(purpose, network)
+        results.append((index, wallet_data))
+    return results
+
+
+def generate_wallets_batch(
+    specs: List[Dict[str, str]],
+    max_workers: Optional[int] = None,
+    simple: bool = False,
+) -> List[Dict[str, str]]:
+    """Generate wallets for {"ticker", "purpose", "network", "complete"} specs"""
+    # A ticker's wallets share its mnemonic, so they run in order in one
+    # worker; tickers run in parallel. Results come back in spec order.
+    if simple and any(spec.get("complete") for spec in specs):
+        raise click.ClickException("Complete mode requires real tools")
+
+    by_ticker: Dict[str, List[Tuple[int, str, str, bool]]] = {}
+    for index, spec in enumerate(specs):
+        by_ticker.setdefault(spec["ticker"].upper(), []).append(
+            (
+                index,
+                spec["purpose"],
+                spec.get("network", "mainnet"),
+                bool(spec.get("complete", False)),
+            )
+        )
+
+    # Resolve (and if needed download) the tools once, so workers never
+    # race each other writing the same binaries
+    tools = None if simple else verify_tools()
+
+    workers = min(len(by_ticker), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        batches = [
+            _generate_ticker_batch(ticker, ticker_specs, tools)
+            for ticker, ticker_specs in by_ticker.items()
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_generate_ticker_batch, ticker, ticker_specs, tools)
+                for ticker, ticker_specs in by_ticker.items()
+            ]
+            batches = [future.result() for future in futures]
+
+    results: List[Dict[str, str]] = [{} for _ in specs]
+    for batch in batches:
+        for index, wallet_data in batch:
+            results[index] = wallet_data
+    return results
+
+
 # Real wallet
 # Address verification
 # Cross verification
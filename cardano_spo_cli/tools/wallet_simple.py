@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Simplified wallet generation module."""
 
+import os
 import click
 import hashlib
 import hmac
@@ -8,6 +9,8 @@ from pathlib import Path
 from mnemonic import Mnemonic
 from colorama import Fore, Style
 
+from ._fileio import write_file
+
 
 class SimpleCardanoWalletGenerator:
     def __init__(self, ticker: str):
@@ -30,8 +33,7 @@ class SimpleCardanoWalletGenerator:
             # Create new shared mnemonic
             mnemonic = self.mnemo.generate(strength=256)
             # Save shared mnemonic with secure permissions
-            self.shared_mnemonic_file.write_text(mnemonic)
-            self.shared_mnemonic_file.chmod(0o600)  # Secure permissions
+            write_file(os.fspath(self.shared_mnemonic_file), mnemonic, 0o600)
             click.echo(f"🔐 Created new shared mnemonic for {self.ticker}")
             return mnemonic
 
@@ -130,38 +132,29 @@ class SimpleCardanoWalletGenerator:
 
         # Base address
         base_addr_file = wallet_dir / f"{self.ticker}-{purpose}.base_addr"
-        with open(base_addr_file, "w") as f:
-            f.write(base_addr)
+        base_addr_file.write_text(base_addr)
         files_saved.append(base_addr_file)
 
         # Reward address
         reward_addr_file = wallet_dir / f"{self.ticker}-{purpose}.reward_addr"
-        with open(reward_addr_file, "w") as f:
-            f.write(reward_addr)
+        reward_addr_file.write_text(reward_addr)
         files_saved.append(reward_addr_file)
 
         # Staking private key
         staking_skey_file = wallet_dir / f"{self.ticker}-{purpose}.staking_skey"
-        with open(staking_skey_file, "w") as f:
-            f.write(staking_skey.hex())
+        write_file(os.fspath(staking_skey_file), staking_skey.hex(), 0o600)
         files_saved.append(staking_skey_file)
 
         # Staking public key
         staking_vkey_file = wallet_dir / f"{self.ticker}-{purpose}.staking_vkey"
-        with open(staking_vkey_file, "w") as f:
-            f.write(staking_vkey.hex())
+        staking_vkey_file.write_text(staking_vkey.hex())
         files_saved.append(staking_vkey_file)
 
         # Recovery phrase
         mnemonic_file = wallet_dir / f"{self.ticker}-{purpose}.mnemonic.txt"
-        with open(mnemonic_file, "w") as f:
-            f.write(mnemonic)
+        write_file(os.fspath(mnemonic_file), mnemonic, 0o600)
         files_saved.append(mnemonic_file)
 
-        # Make sensitive files more secure
-        for file in [staking_skey_file, mnemonic_file]:
-            file.chmod(0o600)  # Read/write for owner only
-
         click.echo(f"{Fore.GREEN}Wallet generated in: {wallet_dir}{Style.RESET_ALL}")
 
         return {
@@ -18,6 +18,9 @@ setup(
         "colorama>=0.4.4",
         "tqdm>=4.62.0",
     ],
+    extras_require={
+        "native": ["pycardano>=0.9.0", "orjson>=3.8.0"],
+    },
     entry_points={
         "console_scripts": [
             "cspocli=cardano_spo_cli.cli:main",
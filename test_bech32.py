@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the local Bech32 codec used by the wallet module
+"""
+
+import os
+
+import bech32
+
+from cardano_spo_cli.tools.wallet import (
+    _bech32_decode,
+    _bech32_encode,
+    _try_bech32,
+)
+
+
+def reference_encode(hrp, data):
+    """Encode with the bech32 package"""
+    return bech32.bech32_encode(hrp, bech32.convertbits(data, 8, 5))
+
+
+def test_round_trip_matches_reference():
+    """Encoding and decoding agree with the bech32 package"""
+    for length in range(1, 48):
+        data = os.urandom(length)
+        for hrp in ("addr_vkh", "stake_vk", "pool"):
+            encoded = _bech32_encode(hrp, data)
+            assert encoded == reference_encode(hrp, data)
+            assert bech32.bech32_decode(encoded)[0] == hrp
+            assert _bech32_decode(encoded) == (hrp, data)
+
+
+def test_checksum_failure():
+    """A single changed character breaks the checksum"""
+    encoded = _bech32_encode("addr_vk", os.urandom(32))
+    position = len("addr_vk") + 5
+    replacement = "q" if encoded[position] != "q" else "p"
+    corrupted = encoded[:position] + replacement + encoded[position + 1 :]
+    assert _bech32_decode(corrupted) == (None, None)
+    assert _bech32_decode(encoded[:-1]) == (None, None)
+
+
+def test_long_cardano_strings():
+    """Strings over the BIP-173 90 character limit still round-trip"""
+    # Base address (header byte + two key hashes) and an extended root key
+    for hrp, data in (
+        ("addr", bytes([0x01]) + os.urandom(56)),
+        ("root_xsk", os.urandom(96)),
+    ):
+        encoded = _bech32_encode(hrp, data)
+        assert len(encoded) > 90
+        assert encoded == reference_encode(hrp, data)
+        assert _bech32_decode(encoded) == (hrp, data)
+
+
+def test_mixed_case():
+    """Either case decodes, a mix of both is rejected"""
+    data = os.urandom(29)
+    encoded = _bech32_encode("addr_test", data)
+    assert _bech32_decode(encoded.upper()) == ("addr_test", data)
+    mixed = encoded[:-1] + encoded[-1].upper()
+    if mixed == encoded:
+        mixed = encoded[0].upper() + encoded[1:]
+    assert _bech32_decode(mixed) == (None, None)
+
+
+def test_surrounding_whitespace():
+    """Padded strings are rejected rather than trimmed"""
+    data = os.urandom(29)
+    encoded = _bech32_encode("addr", data)
+    for padded in (" " + encoded, encoded + "\n", f" {encoded} \n", "\t" + encoded):
+        assert _bech32_decode(padded) == (None, None)
+    assert _bech32_decode(encoded) == ("addr", data)
+
+
+def test_bad_hrp():
+    """Wrong, empty or out-of-range prefixes are rejected"""
+    data = os.urandom(28)
+    encoded = _bech32_encode("addr_vkh", data)
+
+    # The checksum covers the prefix
+    assert _bech32_decode("stake_vkh" + encoded[len("addr_vkh") :]) == (None, None)
+
+    # No separator, or nothing before it
+    assert _bech32_decode(encoded.replace("1", "", 1)) == (None, None)
+    assert _bech32_decode(encoded[len("addr_vkh") :]) == (None, None)
+
+    # Characters outside US-ASCII 33-126, even with a matching checksum
+    assert _bech32_decode(_bech32_encode("addr vkh", data)) == (None, None)
+
+    # Valid, but not a prefix the converters accept
+    assert _try_bech32(_bech32_encode("pool", data)) is None
+    assert _try_bech32(encoded) == data
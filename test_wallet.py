@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Tests for the wallet generator helpers
+"""
+
+import asyncio
+import json
+import os
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import click
+import pytest
+from mnemonic import Mnemonic
+
+from cardano_spo_cli.tools import wallet
+from cardano_spo_cli.tools.wallet import CardanoWalletGenerator
+
+# verify_tools() would look for (and download) the real binaries
+TOOLS = {"cardano-address": Path("/bin/true")}
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Point Path.home() at an empty directory"""
+    monkeypatch.setenv("HOME", os.fspath(tmp_path))
+    return tmp_path
+
+
+def test_root_key_cache_follows_mnemonic(home):
+    """A mnemonic swapped in with the same mtime gets its own root key"""
+    generator = CardanoWalletGenerator("tst", TOOLS)
+    first = generator.get_or_create_shared_mnemonic()
+    first_root = generator.mnemonic_to_root_key(first)
+
+    # Replace the mnemonic the way cp -p or a backup restore would
+    mnemonic_file = generator.shared_mnemonic_file
+    stat = mnemonic_file.stat()
+    second = generator.generate_mnemonic()
+    mnemonic_file.write_text(second)
+    os.utime(mnemonic_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    generator = CardanoWalletGenerator("tst", TOOLS)
+    assert generator.get_or_create_shared_mnemonic() == second
+    second_root = generator.mnemonic_to_root_key(second)
+    assert second_root != first_root
+    assert second_root == generator._derive_root_key(second)
+
+
+def test_root_key_cache_reused(home, monkeypatch):
+    """The persisted root key is reused for an unchanged mnemonic"""
+    generator = CardanoWalletGenerator("tst", TOOLS)
+    mnemonic = generator.get_or_create_shared_mnemonic()
+    root_key = generator.mnemonic_to_root_key(mnemonic)
+
+    generator = CardanoWalletGenerator("tst", TOOLS)
+
+    def derive(mnemonic):
+        raise AssertionError("root key derived again")
+
+    monkeypatch.setattr(generator, "_derive_root_key", derive)
+    assert generator.get_or_create_shared_mnemonic() == mnemonic
+    assert generator.mnemonic_to_root_key(mnemonic) == root_key
+
+
+def test_imported_addresses_reused(home, tmp_path, monkeypatch):
+    """Importing the same keys again reuses the derived addresses"""
+    pytest.importorskip("pycardano")
+    monkeypatch.setattr(wallet, "verify_tools", lambda: dict(TOOLS))
+    monkeypatch.setattr(wallet, "_IMPORTED_ADDRESSES", OrderedDict())
+
+    paths = {}
+    for name in ("payment", "stake"):
+        paths[name] = tmp_path / f"{name}.vkey"
+        paths[name].write_text(json.dumps({"cborHex": "5820" + os.urandom(32).hex()}))
+
+    derived = []
+    derive = CardanoWalletGenerator._derive_imported_addresses
+
+    def count(self, *key):
+        derived.append(key)
+        return derive(self, *key)
+
+    monkeypatch.setattr(CardanoWalletGenerator, "_derive_imported_addresses", count)
+
+    results = [
+        wallet.generate_wallet_real_with_import(
+            "tst",
+            purpose,
+            "preprod",
+            payment_vkey_path=os.fspath(paths["payment"]),
+            stake_vkey_path=os.fspath(paths["stake"]),
+        )
+        for purpose in ("pledge", "rewards")
+    ]
+    assert len(derived) == 1
+    assert results[0]["base_addr"] == results[1]["base_addr"]
+    assert results[0]["base_addr"].startswith("addr_test1")
+
+
+@pytest.mark.parametrize("strength", [128, 256])
+def test_generate_mnemonic_matches_reference(strength, monkeypatch):
+    """The phrase for fixed entropy matches the mnemonic package"""
+    mnemo = Mnemonic("english")
+    for entropy in (
+        bytes(strength // 8),
+        b"\xff" * (strength // 8),
+        bytes(range(strength // 8)),
+        os.urandom(strength // 8),
+    ):
+        monkeypatch.setattr(wallet.secrets, "token_bytes", lambda size: entropy)
+        phrase = wallet._generate_mnemonic(mnemo.wordlist, strength)
+        assert phrase == mnemo.to_mnemonic(entropy)
+        assert len(phrase.split()) == strength * 33 // 32 // 11
+        assert mnemo.check(phrase)
+
+
+def test_run_async_inside_running_loop():
+    """_run_async also works when called from a running event loop"""
+
+    async def spawn():
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", "print('ok')", stdout=asyncio.subprocess.PIPE
+        )
+        stdout, _ = await process.communicate()
+        return stdout.decode().strip()
+
+    async def caller():
+        return wallet._run_async(spawn())
+
+    assert wallet._run_async(spawn()) == "ok"
+    assert asyncio.run(caller()) == "ok"
+
+
+def test_generate_wallets_batch_keeps_tickers_apart(home):
+    """Each ticker gets its own directory and shared mnemonic"""
+    specs = [
+        {"ticker": "aaa", "purpose": "pledge"},
+        {"ticker": "bbb", "purpose": "pledge", "network": "preprod"},
+        {"ticker": "aaa", "purpose": "rewards"},
+    ]
+    results = wallet.generate_wallets_batch(specs, max_workers=2, simple=True)
+
+    assert len(results) == 3
+    assert results[0]["mnemonic"] == results[2]["mnemonic"]
+    assert results[0]["mnemonic"] != results[1]["mnemonic"]
+    assert results[1]["base_addr"].startswith("addr_test")
+
+    for ticker, result in (("AAA", results[0]), ("BBB", results[1])):
+        ticker_dir = home / f".CSPO_{ticker}"
+        shared = ticker_dir / f"{ticker}-shared.mnemonic.txt"
+        assert shared.read_text().strip() == result["mnemonic"]
+        assert (ticker_dir / "pledge" / f"{ticker}-pledge.base_addr").exists()
+    assert (home / ".CSPO_AAA" / "rewards").is_dir()
+    assert not (home / ".CSPO_BBB" / "rewards").exists()
+
+
+def test_generate_wallets_batch_simple_rejects_complete(home):
+    """Complete stake pool files need the real tools"""
+    with pytest.raises(click.ClickException):
+        wallet.generate_wallets_batch(
+            [{"ticker": "aaa", "purpose": "pledge", "complete": True}], simple=True
+        )